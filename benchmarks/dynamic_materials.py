@@ -0,0 +1,81 @@
+"""
+Counts the surfaces that are allocated while rendering text with materials that update every tick.
+
+A View of labels is rendered for a number of frames. During those frames, every pygame.Surface that is
+created and every call to Surface.copy is counted. Labels whose materials update every tick are composited
+in reusable scratch surfaces, so after the first frame both counts should be zero.
+
+Run with ``python benchmarks/dynamic_materials.py``.
+"""
+
+import cProfile
+import pstats
+import time
+
+import pygame
+import ember
+from ember.material import AverageColor, Color
+from ember.style import pixel_dark as ui
+
+LABELS = 30
+FRAMES = 100
+BACKGROUND = (40, 40, 50)
+
+
+class CountingSurface(pygame.Surface):
+    created = 0
+
+    def __init__(self, *args, **kwargs) -> None:
+        CountingSurface.created += 1
+        super().__init__(*args, **kwargs)
+
+
+def count_copies(profile: cProfile.Profile) -> int:
+    for (_, _, name), (calls, *_) in pstats.Stats(profile).stats.items():
+        if name == "<method 'copy' of 'pygame.surface.Surface' objects>":
+            return calls
+    return 0
+
+
+def benchmark(name: str, material) -> None:
+    display = pygame.Surface((300, 600))
+    with ember.View() as view:
+        with ui.VStack(spacing=2):
+            for n in range(LABELS):
+                ui.Text(f"Label number {n}", material=material)
+
+    # The first frames lay out the labels and create their surfaces
+    for _ in range(2):
+        display.fill(BACKGROUND)
+        view.update(display)
+
+    profile = cProfile.Profile()
+    CountingSurface.created = 0
+    original_surface, pygame.Surface = pygame.Surface, CountingSurface
+    try:
+        start = time.perf_counter()
+        profile.enable()
+        for _ in range(FRAMES):
+            display.fill(BACKGROUND)
+            view.update(display)
+        profile.disable()
+        frame_time = (time.perf_counter() - start) / FRAMES
+    finally:
+        pygame.Surface = original_surface
+
+    print(
+        f"{name:>14}{CountingSurface.created:>12}{count_copies(profile):>10}"
+        f"{frame_time * 1e3:>12.2f}"
+    )
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    ember.init()
+    ember.set_clock(pygame.time.Clock())
+
+    print(f"{LABELS} labels, {FRAMES} frames")
+    print(f"{'material':>14}{'surfaces':>12}{'copies':>10}{'frame (ms)':>12}")
+    benchmark("AverageColor", AverageColor())
+    benchmark("Color", Color("white"))
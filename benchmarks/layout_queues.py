@@ -0,0 +1,114 @@
+"""
+Measures the cost of the ViewLayer layout queues as the element tree grows.
+
+The first table queues every element of a synthetic tree and pops them all again, using ElementQueue
+and the plain sorted list that ViewLayer used before it. The cost per element should stay flat for
+ElementQueue, and grow with the number of elements for the list.
+
+The second table refreshes every element of a real View in one tick, like a stat panel being updated,
+and reports the time per element.
+
+Run with ``python benchmarks/layout_queues.py``.
+"""
+
+import time
+
+import pygame
+import ember
+from ember.style import pixel_dark as ui
+from ember.ui.element_queue import ElementQueue
+
+SIZES = (250, 500, 1000, 2000, 4000)
+TREE_DEPTH = 6
+REPEATS = 5
+
+
+class Node:
+    __slots__ = ("ancestry",)
+
+    def __init__(self, ancestry: list["Node"]) -> None:
+        self.ancestry: list["Node"] = ancestry
+
+
+def make_nodes(count: int) -> list[Node]:
+    nodes = []
+    for n in range(count):
+        ancestry = []
+        for _ in range(n % TREE_DEPTH):
+            ancestry = [*ancestry, Node(ancestry)]
+        nodes.append(Node(ancestry))
+    return nodes
+
+
+def run_element_queue(nodes: list[Node]) -> None:
+    queue = ElementQueue()
+    for node in nodes:
+        queue.add(node)
+        # Requests for elements that are already queued are ignored
+        queue.add(node)
+    while queue:
+        queue.pop()
+
+
+def run_list_queue(nodes: list[Node]) -> None:
+    # The queue that ViewLayer used before ElementQueue
+    queue = []
+    for node in nodes:
+        if node not in queue:
+            queue.append(node)
+        if node not in queue:
+            queue.append(node)
+    while queue:
+        queue.sort(key=lambda x: len(x.ancestry))
+        queue.pop(0)
+
+
+def best_time(func, *args) -> float:
+    best = float("inf")
+    for _ in range(REPEATS):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def benchmark_queues() -> None:
+    print("Queue and pop every element once (us per element)")
+    print(f"{'elements':>10}{'ElementQueue':>16}{'list':>12}")
+    for size in SIZES:
+        nodes = make_nodes(size)
+        element_queue = best_time(run_element_queue, nodes) / size * 1e6
+        list_queue = best_time(run_list_queue, nodes) / size * 1e6
+        print(f"{size:>10}{element_queue:>16.2f}{list_queue:>12.2f}")
+
+
+def benchmark_view() -> None:
+    print()
+    print("Refresh every element of a View in one tick (us per element)")
+    print(f"{'elements':>10}{'tick':>12}")
+    display = pygame.Surface((300, 200))
+    for size in SIZES:
+        with ember.View() as view:
+            with ui.VStack(h=200) as stack:
+                elements = [ember.ui.Spacer(w=20, h=5) for _ in range(size)]
+        view.update(display)
+
+        best = float("inf")
+        for n in range(REPEATS):
+            with ember.batch():
+                for element in elements:
+                    element.w = 20 + n % 2
+            start = time.perf_counter()
+            view.update(display)
+            best = min(best, time.perf_counter() - start)
+        print(f"{size:>10}{best / size * 1e6:>12.2f}")
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    ember.init()
+    ember.set_clock(pygame.time.Clock())
+
+    benchmark_queues()
+    benchmark_view()
@@ -0,0 +1,75 @@
+"""
+Compares the cost of reading and writing a Trait on an Element with a plain slot and a minimal
+pure-Python descriptor.
+
+Run with ``python benchmarks/trait_access.py``.
+"""
+
+import timeit
+
+import pygame
+import ember
+from ember.ui import Spacer
+
+READS = 1_000_000
+WRITES = 100_000
+
+
+class Slotted:
+    __slots__ = ("w",)
+
+    def __init__(self) -> None:
+        self.w = 10
+
+
+class Descriptor:
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = "_" + name
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        return getattr(instance, self.name)
+
+    def __set__(self, instance, value) -> None:
+        setattr(instance, self.name, value)
+
+
+class Described:
+    w = Descriptor()
+
+    def __init__(self) -> None:
+        self.w = 10
+
+
+def time_per_call(statement: str, number: int, **namespace) -> float:
+    return min(timeit.repeat(statement, globals=namespace, number=number, repeat=5)) / number
+
+
+def benchmark() -> None:
+    element = Spacer(w=10, h=10)
+    targets = (
+        ("plain slot", Slotted()),
+        ("descriptor", Described()),
+        ("Trait", element),
+    )
+
+    print(f"{'':>12}{'read (ns)':>12}{'x slot':>8}{'write (ns)':>12}{'x slot':>8}")
+    slot_read = slot_write = None
+    for name, target in targets:
+        read = time_per_call("target.w", READS, target=target)
+        write = time_per_call("target.w = 10; target.w = 20", WRITES, target=target) / 2
+        if slot_read is None:
+            slot_read, slot_write = read, write
+        print(
+            f"{name:>12}{read * 1e9:>12.0f}{read / slot_read:>8.1f}"
+            f"{write * 1e9:>12.0f}{write / slot_write:>8.1f}"
+        )
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    ember.init()
+
+    benchmark()
@@ -0,0 +1,74 @@
+"""
+Measures Font.get_width_of when the text has to fit within a maximum height.
+
+For each length of text, the narrowest width that fits is found with the binary search in Font.get_width_of,
+with the linear search that it replaced, and again with the memoized result. Both searches must agree.
+
+Run with ``python benchmarks/width_fitting.py``.
+"""
+
+import random
+import time
+
+import pygame
+import ember
+from ember.font import Font, PygameFont
+from ember.style import pixel_dark as ui
+
+LENGTHS = (250, 500, 1000, 2000)
+MAX_HEIGHT = 200
+WORDS = "the quick brown fox jumps over a lazy dog while five boxing wizards jump quickly".split()
+
+
+def make_text(length: int) -> str:
+    rng = random.Random(length)
+    text = ""
+    while len(text) < length:
+        text += rng.choice(WORDS) + " "
+    return text[:length].strip()
+
+
+def linear_width_of(font: Font, text: str, max_height: float) -> int:
+    # The search that Font.get_width_of used before it was changed to a binary search
+    width = 10
+    while True:
+        width += 1
+        if font.get_height_of(text, width, ()) <= max_height:
+            return width
+
+
+def timed(func, *args) -> tuple[float, int]:
+    start = time.perf_counter()
+    result = func(*args)
+    return time.perf_counter() - start, result
+
+
+def benchmark(name: str, font: Font) -> None:
+    print(f"{name} (ms)")
+    print(f"{'characters':>12}{'linear':>12}{'binary':>12}{'cached':>12}{'width':>8}")
+    for length in LENGTHS:
+        text = make_text(length)
+        font._fitted_widths.clear()
+
+        linear_time, linear_width = timed(linear_width_of, font, text, MAX_HEIGHT)
+        binary_time, width = timed(font.get_width_of, text, (), 0, MAX_HEIGHT)
+        cached_time, _ = timed(font.get_width_of, text, (), 0, MAX_HEIGHT)
+
+        if width != linear_width:
+            raise AssertionError(
+                f"Binary search found width {width}, linear search found {linear_width}."
+            )
+        print(
+            f"{length:>12}{linear_time * 1e3:>12.2f}{binary_time * 1e3:>12.2f}"
+            f"{cached_time * 1e3:>12.3f}{width:>8}"
+        )
+    print()
+
+
+if __name__ == "__main__":
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    ember.init()
+
+    benchmark("PixelFont", ui.Text.font.default_value)
+    benchmark("PygameFont", PygameFont(pygame.font.Font(None, 20)))
@@ -45,10 +45,13 @@ while running:
                 print("Clicked!")
 
     display.fill(ui.background_color)
-    view.update(display)
+    dirty_rects = view.update(display)
     screen.blit(pygame.transform.scale(display, (WIDTH*ZOOM, HEIGHT*ZOOM)), (0, 0))
 
     clock.tick(60)
-    pygame.display.flip()
+    # Only present the areas of the screen that changed
+    pygame.display.update(
+        [pygame.Rect(r.x * ZOOM, r.y * ZOOM, r.w * ZOOM, r.h * ZOOM) for r in dirty_rects]
+    )
 
 pygame.quit()
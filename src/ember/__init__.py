@@ -17,7 +17,7 @@ from .common import (
 )
 
 from . import trait
-from .trait import Trait
+from .trait import Trait, batch
 
 from . import event
 from .event import *
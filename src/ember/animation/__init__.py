@@ -3,3 +3,4 @@ from .animation_context import AnimationContext
 from .linear import Linear
 from .ease import EaseIn, EaseOut, EaseInOut
 from .spring import Spring
+from .animation_scheduler import AnimationScheduler
@@ -1,4 +1,4 @@
-from typing import Any, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING, Optional
 from .animated_value import (
     AnimatedValue,
     AnimatedSizeValue,
@@ -14,6 +14,7 @@ from .. import common as _c
 if TYPE_CHECKING:
     from ember.trait.trait import TraitContext
     from .animation import Animation
+    from .animation_scheduler import AnimationScheduler
 
 
 class AnimationContext:
@@ -29,6 +30,8 @@ class AnimationContext:
 
         self.value: float = 0
 
+        self.scheduler: Optional["AnimationScheduler"] = None
+
         self.target: AnimatedValue
 
         if isinstance(new_value, Size):
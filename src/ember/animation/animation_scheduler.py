@@ -0,0 +1,65 @@
+from typing import TYPE_CHECKING
+
+from ..trait.trait_batch import batch
+
+if TYPE_CHECKING:
+    from ember.ui.element import Element
+    from .animation_context import AnimationContext
+
+
+class AnimationScheduler:
+    """
+    Advances the active animations of every Element in a :py:class:`View<ember.ui.View>` in a single pass
+    each tick. The trait callbacks of all of the animations are sent together at the end of the pass,
+    so each animated Element is only queued for layout once per tick, however many of its traits are animating.
+    Used internally by the library.
+    """
+
+    __slots__ = ("_contexts",)
+
+    def __init__(self) -> None:
+        self._contexts: dict["AnimationContext", "Element"] = {}
+
+    def __repr__(self) -> str:
+        return f"<AnimationScheduler({len(self._contexts)} animations)>"
+
+    def __len__(self) -> int:
+        return len(self._contexts)
+
+    def add(self, element: "Element", context: "AnimationContext") -> None:
+        """
+        Start advancing an animation context of an Element.
+        """
+        context.scheduler = self
+        self._contexts[context] = element
+
+    def discard(self, context: "AnimationContext") -> None:
+        """
+        Stop advancing an animation context, if it is scheduled.
+        """
+        if self._contexts.pop(context, None) is not None:
+            context.scheduler = None
+
+    def update(self) -> None:
+        """
+        Advance all scheduled animations by one tick, finishing those that are complete.
+        """
+        if not self._contexts:
+            return
+
+        with batch():
+            finished = [
+                (context, element)
+                for context, element in list(self._contexts.items())
+                if context._update()
+            ]
+            for context, element in finished:
+                context._finish()
+                self.discard(context)
+                if context in element._animation_contexts:
+                    element._animation_contexts.remove(context)
+
+    def clear(self) -> None:
+        for context in self._contexts:
+            context.scheduler = None
+        self._contexts.clear()
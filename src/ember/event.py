@@ -20,6 +20,8 @@ TOGGLEDOFF = pygame.event.custom_type()
 
 VALUEMODIFIED = pygame.event.custom_type()
 
+SCROLLMOVED = pygame.event.custom_type()
+
 VIEWEXITSTARTED = pygame.event.custom_type()
 VIEWEXITFINISHED = pygame.event.custom_type()
 
@@ -5,4 +5,5 @@ from .ttf_font import PygameFont
 from .icon_font import IconFont
 
 from .line import Line
+from .text_cache import TextCache, text_cache_stats, set_text_cache_limits, clear_text_cache
 from .variant import *
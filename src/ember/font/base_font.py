@@ -1,15 +1,19 @@
 import abc
 import math
+import os
+from itertools import accumulate
 
 import pygame
-from typing import Optional, Sequence
+from typing import Optional, Sequence, Iterator
 
-from .. import common as _c
 
 from ember.position.position import Position
 
 from .line import Line
 from .variant import TextVariant
+from .text_cache import shared_text_cache
+
+FITTED_WIDTH_CACHE_SIZE = 256
 
 
 class Font(abc.ABC):
@@ -26,6 +30,8 @@ class Font(abc.ABC):
         self.cursor: pygame.Surface = cursor
         self.cursor_offset: Sequence[int] = cursor_offset
 
+        self._fitted_widths: dict[tuple[str, tuple, float], int] = {}
+
     @abc.abstractmethod
     def get_width_of_line(self, text: str, variant: Sequence[TextVariant]) -> int:
         pass
@@ -41,64 +47,124 @@ class Font(abc.ABC):
         if (w := self.get_width_of_line(text, variant)) < max_width:
             return w
 
-        width = 10
-        while True:
-            width += 1
-            if (h := self.get_height_of(text, max_width=width)) <= max_height:
-                return width
+        key = (text, tuple(variant) if isinstance(variant, Sequence) else variant, max_height)
+        if (width := self._fitted_widths.get(key)) is None:
+            width = self._fit_width(text, variant, max_height, w)
+            if len(self._fitted_widths) >= FITTED_WIDTH_CACHE_SIZE:
+                # Forget the oldest result
+                del self._fitted_widths[next(iter(self._fitted_widths))]
+            self._fitted_widths[key] = width
+        return width
+
+    def _fit_width(
+        self, text: str, variant: TextVariant, max_height: float, line_width: int
+    ) -> int:
+        """
+        Binary search for the narrowest width (above 10) that the text can be wrapped to without
+        exceeding max_height. The height of wrapped text never increases as the width increases,
+        so this needs O(log(line_width)) wraps rather than one wrap for every candidate width.
+        """
+        # split_into_lines measures lines using character advances, which can differ slightly from line_width
+        advance_width = sum(self.get_character_widths(text, variant)) + self.get_line_padding(variant)
+        low, high = 11, max(11, line_width, advance_width)
+        if self.get_height_of(text, high, variant) > max_height:
+            # The text can't fit no matter how wide it is, e.g. because of line breaks
+            return high
 
-    def get_height_of(self, text: str, max_width: float) -> int:
+        while low < high:
+            middle = (low + high) // 2
+            if self.get_height_of(text, middle, variant) <= max_height:
+                high = middle
+            else:
+                low = middle + 1
+        return low
+
+    def get_height_of(
+        self, text: str, max_width: float, variant: Sequence[TextVariant] = ()
+    ) -> int:
         if max_width == 0:
             return 0
 
-        lines = [i for i in self.split_into_lines(text, max_width)]
-        return len(lines) * (self.line_height + self.line_spacing) - self.line_spacing
+        lines = sum(1 for _ in self.split_into_lines(text, max_width, variant))
+        return lines * (self.line_height + self.line_spacing) - self.line_spacing
     
     def get_layers(self, variant: Sequence[TextVariant]) -> list[int]:
         return [1]
 
-    def split_into_lines(self, text, max_width, variant: Sequence[TextVariant]):
-        last_n = 0
-        letter_n = -1
+    def get_character_widths(
+        self, text: str, variant: Sequence[TextVariant]
+    ) -> list[int]:
+        """
+        Returns the horizontal advance of each character in the text. The width of a line is the sum of the
+        advances of its characters, plus the value returned by :py:meth:`get_line_padding`.
+        """
+        return [self.get_width_of_line(i, variant) for i in text]
 
-        while letter_n < len(text) - 1:
-            letter_n += 1
-            if letter_n < 0:
-                raise _c.Error("internal font error")
+    def get_line_padding(self, variant: Sequence[TextVariant]) -> int:
+        """
+        Returns the width that is added to every line, in addition to the advances of its characters.
+        """
+        return 0
+
+    def split_into_lines(self, text, max_width, variant: Sequence[TextVariant]):
+        for start_index, line, _ in self._wrap_lines(text, max_width, variant):
+            yield start_index, line
 
-            line_width = self.get_width_of_line(text[last_n : letter_n + 1], variant)
+    def _wrap_lines(
+        self,
+        text: str,
+        max_width: float,
+        variant: Sequence[TextVariant],
+        start_index: int = 0,
+    ) -> Iterator[tuple[int, str, int]]:
+        """
+        Yields the start index and content of each line, starting with the line that begins at :code:`start_index`.
+        Also yields the index of the last character that was looked at to decide where each line ends.
+        """
+        if not text:
+            return
 
-            if line_width > max_width or text[letter_n] == "\n":
-                letter = text[letter_n]
-                space_n = letter_n
+        # The cumulative advance up to each character, so that the width of
+        # any part of the text can be found without measuring it again
+        widths = list(
+            accumulate(
+                self.get_character_widths(text[start_index:], variant), initial=0
+            )
+        )
+        max_line_width = max_width - self.get_line_padding(variant)
+        last_n = start_index
+        letter_n = start_index
 
-                if letter == "\n":
+        while letter_n < len(text):
+            if (
+                widths[letter_n + 1 - start_index] - widths[last_n - start_index]
+                > max_line_width
+                or text[letter_n] == "\n"
+            ):
+                wrap_end_n = letter_n
+                if text[letter_n] == "\n":
                     this_line = text[last_n : letter_n + 1]
 
                 else:
                     if letter_n - last_n > 1:
-                        while True:
-                            space_n -= 1
-                            if text[space_n] == " ":
-                                letter_n = space_n
-                                break
-                            if space_n - last_n <= 1:
-                                letter_n -= 1
-                                break
+                        # Break at the last space, or before the character that didn't fit if there isn't one
+                        space_n = text.rfind(" ", last_n + 1, letter_n)
+                        letter_n = letter_n - 1 if space_n == -1 else space_n
 
                     this_line = text[last_n : letter_n + 1]
 
                 if this_line[-1] in {" ", "\n"}:
                     this_line = this_line[:-1]
 
-                yield last_n, this_line
+                yield last_n, this_line, wrap_end_n
                 last_n = letter_n + 1
 
-                #if letter == "\n" and letter_n == len(text) - 1:
-                    #yield last_n, ""
+                if letter_n >= len(text) - 1:
+                    break
 
-            if letter_n >= len(text) - 1:
-                yield last_n, text[last_n:]
+            letter_n += 1
+
+        yield last_n, text[last_n:], len(text)
 
     @abc.abstractmethod
     def render(
@@ -108,4 +174,170 @@ class Font(abc.ABC):
         max_width: Optional[int],
         align: Position,
     ) -> tuple[list[pygame.Surface], [Line]]:
-        pass
\ No newline at end of file
+        pass
+
+    def _get_line_x(self, max_width: float, line_width: int, align: Position) -> float:
+        """
+        Returns the x position of a line within the rendered surface.
+        """
+        return round(align.get(max_width, line_width))
+
+    def layout(
+        self,
+        text: str,
+        variant: Sequence[TextVariant],
+        max_width: Optional[int],
+        align: Position,
+    ) -> list[Line]:
+        """
+        Returns the same Line objects as :py:meth:`render<ember.font.Font.render>`, without rendering the text.
+        """
+        if max_width is None:
+            return [Line(content=text)]
+
+        max_width -= abs(align.value)
+        if not text:
+            return [Line(content="", start_x=int(align.get(max(1, max_width), 0)))]
+
+        lines = []
+        for start_index, line, wrap_end_index in self._wrap_lines(
+            text, max_width, variant
+        ):
+            width = self.get_width_of_line(line, variant)
+            lines.append(
+                Line(
+                    content=line,
+                    start_x=self._get_line_x(max_width, width, align),
+                    width=width,
+                    start_index=start_index,
+                    line_index=len(lines),
+                    wrap_end_index=wrap_end_index,
+                )
+            )
+        return lines
+
+    def _render_lines(
+        self,
+        surfaces: list[pygame.Surface],
+        split_lines: Sequence[tuple[int, str, int]],
+        max_width: float,
+        variant: Sequence[TextVariant],
+        align: Position,
+        line_index: int = 0,
+    ) -> list[Line]:
+        """
+        Render lines produced by :py:meth:`_wrap_lines` onto the layer surfaces, starting at the line
+        with index :code:`line_index`. Returns a Line object for each line. By default, each line is rendered
+        on its own with :py:meth:`render<ember.font.Font.render>`. Subclasses can override this to draw
+        the lines directly.
+        """
+        line_pitch = self.line_height + self.line_spacing
+
+        lines = []
+        y = line_index * line_pitch
+
+        for index, line, wrap_end_index in split_lines:
+            line_surfaces, _ = self.render(line, variant, None, align)
+            width = line_surfaces[0].get_width() if line_surfaces else 0
+            x = self._get_line_x(max_width, width, align)
+            for surface, line_surface in zip(surfaces, line_surfaces):
+                surface.blit(line_surface, (x, y))
+
+            y += line_pitch
+            lines.append(
+                Line(
+                    content=line,
+                    start_x=x,
+                    width=width,
+                    start_index=index,
+                    line_index=line_index + len(lines),
+                    wrap_end_index=wrap_end_index,
+                )
+            )
+        return lines
+
+    def render_cached(
+        self,
+        text: str,
+        variant: Sequence[TextVariant],
+        max_width: Optional[int],
+        align: Position,
+        previous: Optional[
+            tuple[str, Sequence[pygame.Surface], Sequence[Line]]
+        ] = None,
+    ) -> tuple[list[pygame.Surface], list[Line]]:
+        """
+        Same as :py:meth:`render<ember.font.Font.render>`, but the result is taken from a cache that
+        is shared between all fonts if the same text has been rendered before. The returned surfaces and
+        lines are shared, and must not be modified.
+
+        :code:`previous` can be the text, surfaces and lines from the last time this method was called with the
+        same variant, max_width and align. If the text isn't cached, the lines before the first changed
+        character are then reused instead of being wrapped and rendered again.
+        """
+        key = (self, text, tuple(variant), max_width, align)
+        if (entry := shared_text_cache.get(key)) is not None:
+            return list(entry[0]), list(entry[1])
+
+        if previous is not None and (
+            result := self._render_changed(text, variant, max_width, align, *previous)
+        ) is not None:
+            # Text that is being edited or typed out isn't cached, so that it doesn't evict everything else
+            return result
+
+        surfaces, lines = self.render(text, variant, max_width, align)
+        shared_text_cache.put(key, surfaces, lines)
+        return surfaces, lines
+
+    def _render_changed(
+        self,
+        text: str,
+        variant: Sequence[TextVariant],
+        max_width: Optional[int],
+        align: Position,
+        previous_text: str,
+        previous_surfaces: Sequence[pygame.Surface],
+        previous_lines: Sequence[Line],
+    ) -> Optional[tuple[list[pygame.Surface], list[Line]]]:
+        """
+        Re-render text that has changed from :code:`previous_text`, reusing the lines before the first changed
+        character. Returns None if no lines can be reused.
+        """
+        if max_width is None or not text or self.line_spacing < 0:
+            return None
+
+        changed_n = len(os.path.commonprefix((previous_text, text)))
+        keep = 0
+        for line in previous_lines:
+            if line.wrap_end_index is None or line.wrap_end_index >= changed_n:
+                break
+            keep += 1
+
+        max_width -= abs(align.value)
+        surface_width = max(1, max_width)
+        if not keep or previous_surfaces[0].get_width() != surface_width:
+            return None
+
+        split_lines = list(
+            self._wrap_lines(
+                text, max_width, variant, previous_lines[keep].start_index
+            )
+        )
+        line_pitch = self.line_height + self.line_spacing
+        height = (keep + len(split_lines)) * line_pitch - self.line_spacing
+        kept_area = (0, 0, surface_width, keep * line_pitch - self.line_spacing)
+
+        surfaces = []
+        for previous_surface in previous_surfaces:
+            surface = pygame.Surface((surface_width, height), pygame.SRCALPHA)
+            # The new surface is transparent, so adding copies the pixels exactly
+            surface.blit(
+                previous_surface, (0, 0), kept_area, special_flags=pygame.BLEND_RGBA_ADD
+            )
+            surfaces.append(surface)
+
+        lines = list(previous_lines[:keep])
+        lines.extend(
+            self._render_lines(surfaces, split_lines, max_width, variant, align, keep)
+        )
+        return surfaces, lines
\ No newline at end of file
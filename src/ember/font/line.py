@@ -1,3 +1,6 @@
+from typing import Optional
+
+
 class Line:
     def __init__(
         self,
@@ -7,6 +10,7 @@ class Line:
         width: int = 0,
         start_index: int = 0,
         line_index: int = 0,
+        wrap_end_index: Optional[int] = None,
     ):
         self.content = content
         self.start_index = start_index
@@ -15,6 +19,9 @@ class Line:
         self.start_y = start_y
         self.width = width
         self.line_index = line_index
+        # The index of the last character that was looked at to decide where the line ends.
+        # The line is wrapped the same way as long as the text up to this index doesn't change
+        self.wrap_end_index = wrap_end_index
 
     def __repr__(self) -> str:
         content = self.content if len(self.content) <= 15 else f"{self.content[:16]}"
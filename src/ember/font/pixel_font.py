@@ -50,6 +50,7 @@ class PixelFont(Font):
         separator_color: Optional[ColorType] = None,
         character_padding: Optional[Sequence[int]] = None,
         kerning: Optional[int] = None,
+        cache_index: bool = False,
     ) -> None:
         if isinstance(path, str):
             path = Path(path)
@@ -99,7 +100,9 @@ class PixelFont(Font):
                 variant = ()
 
             raw_layers = f['layers'] if 'layers' in f else (1,)
-            self.variants[variant] = VariantData(path / f["path"], self.characters, raw_layers, separator_color)
+            self.variants[variant] = VariantData(
+                path / f["path"], self.characters, raw_layers, separator_color, cache_index
+            )
             if not variant:
                 self.variants[variant].load()
 
@@ -128,6 +131,12 @@ class PixelFont(Font):
         The spacing between characters.
         """
 
+        # For each variant, maps characters to their advance and the area of the variant's
+        # sheet that holds each layer of the glyph
+        self._glyphs: dict[
+            VariantData, dict[str, tuple[int, tuple[Optional[pygame.Rect], ...]]]
+        ] = {}
+
         super().__init__(
             line_height=line_height,
             line_spacing=_load_value(line_spacing, data.get("line_spacing"), 1),
@@ -145,36 +154,90 @@ class PixelFont(Font):
         else:
             return "unknown"
 
-    def get_width_of_line(self, text: str, variant: Sequence[TextVariant]) -> int:
-        total = 0  # -self.character_padding[0]
-        if "variant" in self.variants:
-            variant_data = self.variants[variant]
+    def _get_variant_data(
+        self, variant: Union[Sequence[TextVariant], VariantData]
+    ) -> VariantData:
+        if isinstance(variant, VariantData):
+            variant_data = variant
+        elif tuple(variant) in self.variants:
+            variant_data = self.variants[tuple(variant)]
         else:
             variant_data = list(self.variants.values())[0]
 
         if not variant_data.has_loaded:
             with log.font.indent("Line width requested, loading variant...", self):
                 variant_data.load()
+        return variant_data
+
+    def _get_glyph_table(
+        self, variant_data: VariantData
+    ) -> dict[str, tuple[int, tuple[Optional[pygame.Rect], ...]]]:
+        if (table := self._glyphs.get(variant_data)) is None:
+            table = self._glyphs[variant_data] = {}
+        return table
+
+    def _add_glyph(
+        self, char: str, variant_data: VariantData
+    ) -> tuple[int, tuple[Optional[pygame.Rect], ...]]:
+        """
+        Resolve a character to a glyph in the variant's sheet and add it to the glyph table.
+        Unsupported characters are resolved to the matching glyph of the other case, or the 'unknown' glyph.
+        """
+        name = self._read_char(char)
+        glyph = (
+            variant_data.character_sizes[name][1]
+            - sum(self.character_padding)
+            + self.kerning,
+            tuple(
+                None
+                if surf is None
+                else pygame.Rect(surf.get_abs_offset(), surf.get_size())
+                for surf in variant_data.surfaces[name]
+            ),
+        )
+        self._get_glyph_table(variant_data)[char] = glyph
+        return glyph
+
+    def get_character_widths(
+        self, text: str, variant: Union[Sequence[TextVariant], VariantData]
+    ) -> list[int]:
+        variant_data = self._get_variant_data(variant)
+        table = self._get_glyph_table(variant_data)
+        return [
+            (table[i] if i in table else self._add_glyph(i, variant_data))[0]
+            for i in text
+        ]
 
-        for i in text:
-            total += variant_data.character_sizes[self._read_char(i)][1]
-
-        total -= (sum(self.character_padding) - self.kerning) * len(text) - 1
-        total += self.kerning + self.character_padding[1]
+    def get_line_padding(
+        self, variant: Union[Sequence[TextVariant], VariantData]
+    ) -> int:
+        return 1 + self.kerning + self.character_padding[1]
 
-        return total
+    def get_width_of_line(
+        self, text: str, variant: Union[Sequence[TextVariant], VariantData]
+    ) -> int:
+        return sum(self.get_character_widths(text, variant)) + self.get_line_padding(
+            variant
+        )
 
     def _render_text(
         self, text: str, width: int, variant_data: VariantData, layer_n: int
     ) -> pygame.Surface:
         surf = pygame.Surface((max(1, width), self.line_height), pygame.SRCALPHA)
-        offset = sum(self.character_padding) - self.kerning
+        table = self._get_glyph_table(variant_data)
+        sheet = variant_data.sheet
 
+        blit_sequence = []
         x = 0  # -self.character_padding[0]
         for letter in text:
-            surf.blit(variant_data.surfaces[self._read_char(letter)][layer_n], (x, 0))
-            x += variant_data.character_sizes[self._read_char(letter)][1] - offset
+            advance, areas = (
+                table[letter] if letter in table else self._add_glyph(letter, variant_data)
+            )
+            if (area := areas[layer_n]) is not None:
+                blit_sequence.append((sheet, (x, 0), area))
+            x += advance
 
+        surf.blits(blit_sequence, doreturn=False)
         return surf
 
     def _render_line(
@@ -183,32 +246,30 @@ class PixelFont(Font):
         text: str,
         max_width: float,
         y: int,
-        height: int,
         variant_data: VariantData,
         align: Position,
     ) -> tuple[int, int]:
         width = self.get_width_of(text, variant_data)
 
         for n in range(len(variant_data.layers)):
-            new_surf = pygame.Surface((max(1, max_width), y + height), pygame.SRCALPHA)
-            new_surf.blit(surfaces[n], (0, 0))
-
             text_surf = self._render_text(text, width, variant_data, n)
             text_width = text_surf.get_width()
+            x = self._get_line_x(max_width, text_width, align)
+            surfaces[n].blit(text_surf, (x, y))
 
-            x = align.get(max_width, text_width)
+        return x, text_width
 
-            # This equalises some jittering that would otherwise be seen when
-            # resizing the Text element and keeping the content the same
-            if int(text_width % 2) == 1:
-                x -= 0.5
-            # if int(text_width % 2) == 0:
-            #     x -= 0.5
+    def _get_line_x(self, max_width: float, line_width: int, align: Position) -> float:
+        x = align.get(max_width, line_width)
 
-            new_surf.blit(text_surf, (x, y))
-            surfaces[n] = new_surf
+        # This equalises some jittering that would otherwise be seen when
+        # resizing the Text element and keeping the content the same
+        if int(line_width % 2) == 1:
+            x -= 0.5
+        # if int(line_width % 2) == 0:
+        #     x -= 0.5
 
-        return x, text_width
+        return x
 
     def get_layers(self, variant: Sequence[TextVariant]) -> list[int]:
         if tuple(variant) in self.variants:
@@ -246,35 +307,60 @@ class PixelFont(Font):
         max_width: int
         max_width -= abs(align.value)
 
-        height = self.line_height
-
         surface_width = 1 if max_width is None else max(1, max_width)
 
-        surfaces = [
-            pygame.Surface((surface_width, height), pygame.SRCALPHA)
-            for _ in variant_data.layers
-        ]
-
         if not text:
+            surfaces = [
+                pygame.Surface((surface_width, self.line_height), pygame.SRCALPHA)
+                for _ in variant_data.layers
+            ]
             return surfaces, [
                 Line(content="", start_x=int(align.get(surface_width, 0)))
             ]
 
+        # Lay out the lines first so that each surface is only created once, at its final size
+        split_lines = list(self._wrap_lines(text, max_width, variant))
+        line_pitch = self.line_height + self.line_spacing
+        surfaces = [
+            pygame.Surface(
+                (surface_width, len(split_lines) * line_pitch - self.line_spacing),
+                pygame.SRCALPHA,
+            )
+            for _ in variant_data.layers
+        ]
+
+        return surfaces, self._render_lines(
+            surfaces, split_lines, max_width, variant_data, align
+        )
+
+    def _render_lines(
+        self,
+        surfaces: list[pygame.Surface],
+        split_lines: Sequence[tuple[int, str, int]],
+        max_width: float,
+        variant: Union[Sequence[TextVariant], VariantData],
+        align: Position,
+        line_index: int = 0,
+    ) -> list[Line]:
+        variant_data = self._get_variant_data(variant)
+        line_pitch = self.line_height + self.line_spacing
+
         lines = []
-        y = 0
+        y = line_index * line_pitch
 
-        for index, line in self.split_into_lines(text, max_width, variant):
+        for index, line, wrap_end_index in split_lines:
             start_x, end_x = self._render_line(
-                surfaces, line, max_width, y, height, variant_data, align
+                surfaces, line, max_width, y, variant_data, align
             )
-            y += height + self.line_spacing
+            y += line_pitch
             lines.append(
                 Line(
                     content=line,
                     start_x=start_x,
                     width=end_x,
                     start_index=index,
-                    line_index=len(lines),
+                    line_index=line_index + len(lines),
+                    wrap_end_index=wrap_end_index,
                 )
             )
-        return surfaces, lines
+        return lines
@@ -0,0 +1,138 @@
+import pygame
+from collections import OrderedDict
+from typing import Hashable, Optional
+
+from .. import log
+from ..material.surface_cache import CacheStats
+
+from .line import Line
+
+
+class TextCache:
+    """
+    A least-recently-used cache of rendered text, shared between all fonts. Each entry holds the layer
+    surfaces and :py:class:`Line<ember.font.Line>` objects returned by :py:meth:`Font.render<ember.font.Font.render>`.
+    When the cache holds more than :code:`max_entries` entries, or the total size of the cached surfaces
+    exceeds :code:`max_bytes`, the least recently used entries are evicted. Used internally by the library.
+
+    The cached surfaces are shared between every Element that displays the same text, so they must not be modified.
+    """
+
+    def __init__(self, max_bytes: int, max_entries: int) -> None:
+        self.max_bytes: int = max_bytes
+        self.max_entries: int = max_entries
+        self._entries: OrderedDict[
+            Hashable, tuple[tuple[pygame.Surface, ...], tuple[Line, ...]]
+        ] = OrderedDict()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __repr__(self) -> str:
+        return f"<TextCache({len(self._entries)} entries, {self._bytes} bytes)>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _get_entry_bytes(
+        entry: tuple[tuple[pygame.Surface, ...], tuple[Line, ...]]
+    ) -> int:
+        return sum(i.get_pitch() * i.get_height() for i in entry[0])
+
+    def get(
+        self, key: Hashable
+    ) -> Optional[tuple[tuple[pygame.Surface, ...], tuple[Line, ...]]]:
+        """
+        Returns the surfaces and lines cached with a key, or None if nothing is cached with that key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._entries.move_to_end(key)
+        return entry
+
+    def put(
+        self,
+        key: Hashable,
+        surfaces: list[pygame.Surface],
+        lines: list[Line],
+    ) -> None:
+        """
+        Cache the surfaces and lines of some rendered text with a key, evicting other entries if necessary.
+        """
+        if (old_entry := self._entries.pop(key, None)) is not None:
+            self._bytes -= self._get_entry_bytes(old_entry)
+
+        entry = (tuple(surfaces), tuple(lines))
+        size = self._get_entry_bytes(entry)
+        if size > self.max_bytes:
+            return
+
+        self._entries[key] = entry
+        self._bytes += size
+        self._evict()
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes or len(self._entries) > self.max_entries:
+            key, entry = self._entries.popitem(last=False)
+            self._bytes -= self._get_entry_bytes(entry)
+            self._evictions += 1
+            log.font.info(f"Evicted '{key[1][:16]}' from the shared text cache.")
+
+    def set_limits(
+        self, max_bytes: Optional[int] = None, max_entries: Optional[int] = None
+    ) -> None:
+        if max_bytes is not None:
+            self.max_bytes = max_bytes
+        if max_entries is not None:
+            self.max_entries = max_entries
+        self._evict()
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            len(self._entries),
+            self._bytes,
+            self.max_bytes,
+        )
+
+
+DEFAULT_TEXT_CACHE_BUDGET = 16 * 1024 * 1024
+DEFAULT_TEXT_CACHE_ENTRIES = 1024
+
+shared_text_cache = TextCache(DEFAULT_TEXT_CACHE_BUDGET, DEFAULT_TEXT_CACHE_ENTRIES)
+
+
+def text_cache_stats() -> CacheStats:
+    """
+    Returns statistics about the rendered text cache that is shared between all fonts.
+    """
+    return shared_text_cache.stats()
+
+
+def set_text_cache_limits(
+    max_bytes: Optional[int] = None, max_entries: Optional[int] = None
+) -> None:
+    """
+    Set the maximum amount of memory, in bytes, and the maximum number of strings that the
+    shared rendered text cache can hold. The defaults are 16 MiB and 1024 strings.
+    """
+    shared_text_cache.set_limits(max_bytes, max_entries)
+
+
+def clear_text_cache() -> None:
+    """
+    Remove all rendered text from the cache that is shared between all fonts. This should be called
+    after modifying the attributes of a font that has already been used to render text.
+    """
+    shared_text_cache.clear()
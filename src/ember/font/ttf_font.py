@@ -33,6 +33,8 @@ class PygameFont(Font):
 
         self.antialias: bool = antialias
 
+        self._advances: dict[tuple[bool, bool], dict[str, int]] = {}
+
         line_height = self._font.size("|")[1] if line_height is None else line_height
         if cursor is None:
             cursor = pygame.Surface(
@@ -58,6 +60,23 @@ class PygameFont(Font):
         self._font.underline = UNDERLINE in variant
         return self._font.size(text)[0]
 
+    def get_character_widths(self, text: str, variant: Sequence[TextVariant]) -> list[int]:
+        self._font.bold = BOLD in variant
+        self._font.italic = ITALIC in variant
+        key = self._font.bold, self._font.italic
+        if (advances := self._advances.get(key)) is None:
+            advances = self._advances[key] = {}
+
+        widths = []
+        for i in text:
+            if (advance := advances.get(i)) is None:
+                metrics = self._font.metrics(i)
+                advance = advances[i] = (
+                    metrics[0][4] if metrics and metrics[0] else self._font.size(i)[0]
+                )
+            widths.append(advance)
+        return widths
+
     def _render_text(
         self,
         text: str,
@@ -71,20 +90,14 @@ class PygameFont(Font):
         text: str,
         max_width: int,
         y: int,
-        height: int,
         variant: Sequence[TextVariant],
         align: Position,
-    ) -> (pygame.Surface, int, int):
-        old_surf = surf.copy()
-        surf = pygame.Surface((max(1, max_width), y + height), pygame.SRCALPHA)
-        surf.blit(old_surf, (0, 0))
-
-        new_text = text
-        text_surf = self._render_text(new_text, variant)
-        x = round(align.get(max_width, text_surf.get_width()))
+    ) -> (int, int):
+        text_surf = self._render_text(text, variant)
+        x = self._get_line_x(max_width, text_surf.get_width(), align)
 
         surf.blit(text_surf, (x, y))
-        return surf, x, text_surf.get_width()
+        return x, text_surf.get_width()
 
     def render(
         self,
@@ -104,30 +117,52 @@ class PygameFont(Font):
         max_width: int
         max_width -= abs(align.value)
 
-        height = self.line_height
+        surface_width = 1 if max_width is None else max(1, max_width)
+
+        if not text:
+            surf = pygame.Surface((surface_width, self.line_height), pygame.SRCALPHA)
+            return [surf], [Line(content="", start_x=int(align.get(surface_width, 0)))]
 
+        # Lay out the lines first so that the surface is only created once, at its final size
+        split_lines = list(self._wrap_lines(text, max_width, variant))
+        line_pitch = self.line_height + self.line_spacing
         surf = pygame.Surface(
-            (1 if max_width is None else max(1, max_width), height), pygame.SRCALPHA
+            (surface_width, len(split_lines) * line_pitch - self.line_spacing),
+            pygame.SRCALPHA,
         )
 
-        if not text:
-            return surf, [Line(content="", start_x=int(align.get(surf.get_width(), 0)))]
+        return [surf], self._render_lines([surf], split_lines, max_width, variant, align)
+
+    def _render_lines(
+        self,
+        surfaces: list[pygame.Surface],
+        split_lines: Sequence[tuple[int, str, int]],
+        max_width: float,
+        variant: Sequence[TextVariant],
+        align: Position,
+        line_index: int = 0,
+    ) -> list[Line]:
+        self._font.bold = BOLD in variant
+        self._font.italic = ITALIC in variant
+        self._font.underline = UNDERLINE in variant
+        line_pitch = self.line_height + self.line_spacing
 
         lines = []
-        y = 0
+        y = line_index * line_pitch
 
-        for index, line in self.split_into_lines(text, max_width, variant):
-            surf, start_x, end_x = self._render_line(
-                surf, line, max_width, y, height, variant, align
+        for index, line, wrap_end_index in split_lines:
+            start_x, end_x = self._render_line(
+                surfaces[0], line, max_width, y, variant, align
             )
-            y += height + self.line_spacing
+            y += line_pitch
             lines.append(
                 Line(
                     content=line,
                     start_x=start_x,
                     width=end_x,
                     start_index=index,
-                    line_index=len(lines),
+                    line_index=line_index + len(lines),
+                    wrap_end_index=wrap_end_index,
                 )
             )
-        return [surf], lines
+        return lines
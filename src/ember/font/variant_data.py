@@ -1,4 +1,6 @@
 import time
+import json
+import os
 
 import pygame
 from os import PathLike
@@ -16,6 +18,7 @@ class VariantData:
         characters: str,
         raw_layers: Optional[list[int]],
         separator_color: pygame.Color,
+        cache_index: bool = False,
     ):
         if isinstance(path, str):
             path = Path(path)
@@ -24,43 +27,136 @@ class VariantData:
         self.characters: str = characters
         self.separator_color: pygame.Color = separator_color
 
+        self.sheet: Optional[pygame.Surface] = None
+        """
+        The font sheet. The glyph surfaces are subsurfaces of this surface, so it can be used as a glyph atlas.
+        """
+
         self.surfaces: dict[str, list[pygame.Surface]] = {}
         self.character_sizes: dict[str, tuple[int, int]] = {}
 
         self.raw_layers: Optional[list[int]] = raw_layers
         self.layers: list[int] = []
 
+        self.cache_index: bool = cache_index
+        """
+        If True, the positions of the glyphs in the font sheet are saved to a file next to the sheet,
+        and read from that file on later runs for as long as the sheet is unchanged.
+        """
+
         self.has_loaded: bool = False
 
-    def load(
-        self,
-    ) -> None:
+    def _find_separators(self, line: pygame.Surface) -> list[int]:
         """
-        Read the letters into separate subsurfaces.
+        Returns the index of every pixel in a one pixel wide (or tall) surface that matches the separator color.
+        The pixels are compared as bytes rather than read one at a time.
         """
-        start_time = time.time()
-        self.has_loaded = True
+        data = pygame.image.tobytes(line, "RGBA")
+        separator = bytes(self.separator_color)
+        indices = []
+        index = data.find(separator)
+        while index != -1:
+            if index % 4 == 0:
+                indices.append(index // 4)
+                index = data.find(separator, index + 4)
+            else:
+                index = data.find(separator, index + 1)
+        return indices
+
+    def _read_index(self, sheet: pygame.Surface) -> dict:
+        """
+        Find the positions of the layers and glyphs in the font sheet.
+        """
+        width, height = sheet.get_size()
 
-        sheet = pygame.image.load(self.path).convert_alpha()
+        # Determine whether the author included a separator at y = 0 or not
+        start_y = int(sheet.get_at((1, 0)) == self.separator_color)
 
         layer_positions = []
+        previous_y = start_y - 1
+        column = sheet.subsurface((1, 0, 1, height))
+        for y in sorted(
+            {y for y in self._find_separators(column) if y >= start_y} | {height - 1}
+        ):
+            size = y - previous_y - 1
+            layer_positions.append((y - size, size))
+            previous_y = y
 
-        size = 0
-        layer_n = 0
+        # Determine whether the author included a separator at x = 0 or not
+        start_x = int(sheet.get_at((0, 1)) == self.separator_color)
 
-        # Determine whether the author included a separator at y = 0 or not
-        start_y = int(sheet.get_at((1, 0)) == self.separator_color)
+        row = sheet.subsurface((0, 1, width, 1))
+        separators = [x for x in self._find_separators(row) if x >= start_x]
+
+        unknown = None
+        glyphs = []
+        if separators:
+            # The first separator marks the unknown character
+            unknown = (separators[0], 0)
+
+            previous_x = separators[0]
+            for x in separators[1 : len(self.characters) + 1]:
+                size = x - previous_x - 1
+                glyphs.append((x - size, size))
+                previous_x = x
+
+        return {
+            "layer_positions": layer_positions,
+            "unknown": unknown,
+            "glyphs": glyphs,
+        }
+
+    def _get_index_path(self) -> Path:
+        return self.path.with_name(self.path.name + ".index.json")
+
+    def _get_index_key(self) -> dict:
+        stat = os.stat(self.path)
+        return {
+            "mtime": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "characters": self.characters,
+            "separator_color": list(self.separator_color),
+        }
+
+    def _load_index(self, sheet: pygame.Surface) -> dict:
+        """
+        Returns the index of the font sheet, using the index file next to the sheet if caching is enabled
+        and the file is up to date.
+        """
+        if not self.cache_index:
+            return self._read_index(sheet)
+
+        index_path = self._get_index_path()
+        key = self._get_index_key()
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            if data["key"] == key:
+                log.font.info(f"Using index file for '{self.path.name}'.")
+                return data["index"]
+        except (OSError, ValueError, KeyError):
+            pass
+
+        index = self._read_index(sheet)
+        try:
+            with open(index_path, "w", encoding="utf-8") as f:
+                json.dump({"key": key, "index": index}, f)
+        except OSError:
+            log.font.info(f"Couldn't write index file for '{self.path.name}'.")
+        return index
 
-        for y in range(start_y, sheet.get_height()):
-            if y == sheet.get_height() - 1 or sheet.get_at((1, y)) == self.separator_color:
-                layer_positions.append((y - size, size))
-                size = 0
-                layer_n += 1
-            else:
-                size += 1
+    def load(
+        self,
+    ) -> None:
+        """
+        Read the letters into separate subsurfaces.
+        """
+        start_time = time.time()
+        self.has_loaded = True
 
-        size = 0
-        letter = 0
+        sheet = self.sheet = pygame.image.load(self.path).convert_alpha()
+        index = self._load_index(sheet)
+        layer_positions = index["layer_positions"]
 
         self.layers = list(abs(i) for i in self.raw_layers)
         layer_count = len(self.layers)
@@ -72,49 +168,37 @@ class VariantData:
             zip(range(layer_count), self.raw_layers, layer_targets, layer_positions)
         )
 
-        # Determine whether the author included a separator at x = 0 or not
-        start_x = int(sheet.get_at((0, 1)) == self.separator_color)
-
         # Read the unknown character
-        for x in range(start_x, sheet.get_width()):
-            if sheet.get_at((x, 1)) == self.separator_color:
-                self.surfaces["unknown"] = [None] * layer_count
-                self.surfaces["unknown"][0] = sheet.subsurface(
-                    (x - size, 0, size, layer_positions[0][1])
-                )
-                self.character_sizes["unknown"] = (x-size, size)
-                break
+        if index["unknown"] is not None:
+            x, size = index["unknown"]
+            self.surfaces["unknown"] = [None] * layer_count
+            self.surfaces["unknown"][0] = sheet.subsurface(
+                (x, 0, size, layer_positions[0][1])
+            )
+            self.character_sizes["unknown"] = (x, size)
 
         # Read the remaining characters
-        for x in range(x + 1, sheet.get_width()):
-            if sheet.get_at((x, 1)) == self.separator_color:
-                if letter >= len(self.characters):
-                    break
-
-                output = [None] * layer_count
-
-                for n, layer_type, target, (y, h) in layer_data:
-                    subsurf = sheet.subsurface((x - size, y, size, h))
-                    if layer_type >= 0:
-                        if output[target] is None:
-                            output[target] = subsurf
-                        else:
-                            output[target].blit(subsurf, (0, 0))
+        for letter, (x, size) in enumerate(index["glyphs"]):
+            output = [None] * layer_count
+
+            for n, layer_type, target, (y, h) in layer_data:
+                subsurf = sheet.subsurface((x, y, size, h))
+                if layer_type >= 0:
+                    if output[target] is None:
+                        output[target] = subsurf
                     else:
-                        if output[target] is None:
-                            raise ValueError(
-                                "Cannot use subtraction on PixelFont layer because target layer does not yet exist"
-                            )
-                        output[target].blit(
-                            subsurf, (0, 0), special_flags=pygame.BLEND_RGBA_SUB
+                        output[target].blit(subsurf, (0, 0))
+                else:
+                    if output[target] is None:
+                        raise ValueError(
+                            "Cannot use subtraction on PixelFont layer because target layer does not yet exist"
                         )
+                    output[target].blit(
+                        subsurf, (0, 0), special_flags=pygame.BLEND_RGBA_SUB
+                    )
 
-                self.surfaces[self.characters[letter]] = output
-                self.character_sizes[self.characters[letter]] = (x - size, size)
-                size = 0
-                letter += 1
-            else:
-                size += 1
+            self.surfaces[self.characters[letter]] = output
+            self.character_sizes[self.characters[letter]] = (x, size)
 
         if " " in self.surfaces:
             self.surfaces["\n"] = self.surfaces[" "]
@@ -123,5 +207,3 @@ class VariantData:
             self.character_sizes["\r"] = self.character_sizes[" "]
 
         log.font.info(f"Loaded variant '{self.path.name}' in {time.time() - start_time:2f}s.")
-
-
@@ -1,4 +1,5 @@
 from .material import Material, MaterialWithElementCache, MaterialWithSizeCache
+from .surface_cache import CacheStats, cache_stats, set_cache_budget, clear_shared_cache
 
 from .blank import Blank
 from .color import Color
@@ -8,6 +8,7 @@ if TYPE_CHECKING:
 
 class AverageColor(MaterialWithElementCache):
     UPDATES_EVERY_TICK = True
+    READS_SURFACE = True
     
     def __init__(self, hsv_adjustment: Sequence[int] = (0, 0, 0), alpha: int = 255):
         super().__init__(alpha)
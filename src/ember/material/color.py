@@ -31,9 +31,21 @@ class Color(MaterialWithSizeCache):
         The thickness of the shape outline. If set to 0, the material will be filled with no outline.
         """
 
+        # The color and outline that the cached surfaces were rendered with
+        self._rendered_with: tuple[pygame.Color, int] = (pygame.Color(color), outline)
+
     def __repr__(self) -> str:
         return f"<Color({self._color})>"
 
+    def _check_for_changes(self) -> None:
+        """
+        Clear the cache if the color has been modified in-place or the outline has changed since the
+        cached surfaces were rendered.
+        """
+        if self._rendered_with[0] != self._color or self._rendered_with[1] != self.outline:
+            self.clear_cache()
+            self._rendered_with = (pygame.Color(self._color), self.outline)
+
     def _needs_to_render(
         self,
         element: "Element",
@@ -41,13 +53,30 @@ class Color(MaterialWithSizeCache):
         pos: tuple[float, float],
         size: tuple[float, float],
     ) -> bool:
-        if element not in self._cache:
+        self._check_for_changes()
+        if (cached_surface := self.get(element)) is None:
             return True
-        if 0 in self._cache[element].get_size():
+        if 0 in cached_surface.get_size():
             return True
-        return (
-            self._cache[element].get_size() != size
-            or self._cache[element].get_at((0, 0))[:3] != self._color[:-1]
+        return cached_surface.get_size() != size
+
+    def draw(
+        self,
+        element: "Element",
+        surface: pygame.Surface,
+        pos: tuple[int, int],
+        size: tuple[int, int],
+        alpha: int,
+    ) -> None:
+        if self.outline or self._color.a < 255 or alpha * self.alpha < 255 * 255:
+            # Blending is needed, so draw the cached surface
+            super().draw(element, surface, pos, size, alpha)
+            return
+
+        # An opaque fill covers the same pixels that the surface would be blitted to
+        surface.fill(
+            self._color,
+            (int(pos[0]), int(pos[1]), max(0, int(size[0])), max(0, int(size[1]))),
         )
 
     def _render_surface(
@@ -66,7 +95,7 @@ class Color(MaterialWithSizeCache):
 
     def set_color(self, color: ColorType) -> None:
         self._color = pygame.Color(color)
-        self.clear_cache()
+        self._check_for_changes()
 
     color: ColorType = property(fget=lambda self: self._color, fset=_set_color)
 
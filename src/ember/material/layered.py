@@ -18,6 +18,10 @@ class Layered(Material):
         self.materials: Sequence[Material] = materials
         super().__init__(alpha)
 
+    @property
+    def READS_SURFACE(self) -> bool:
+        return any(i.READS_SURFACE for i in self.materials)
+
     def render(
         self,
         element: "Element",
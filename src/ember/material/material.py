@@ -1,13 +1,17 @@
 import pygame
 import abc
-from weakref import WeakKeyDictionary, WeakValueDictionary
+from collections import OrderedDict
+from weakref import WeakKeyDictionary
 
-from typing import TYPE_CHECKING, Optional, Any
+from typing import TYPE_CHECKING, Optional, Any, Hashable
 
 if TYPE_CHECKING:
     from ember.ui.base.element import Element
 
 from .. import log
+from .surface_cache import shared_surface_cache, new_cache_version
+
+ALPHA_VARIANT_CACHE_SIZE = 8
 
 
 class Material(abc.ABC):
@@ -15,6 +19,10 @@ class Material(abc.ABC):
     All materials inherit from this class. This base class should not be instantiated.
     """
     UPDATES_EVERY_TICK = False
+    READS_SURFACE = False
+    """
+    True if the material reads the surface that it is drawn onto, for example to blur it.
+    """
 
     def __init__(self, alpha: int):
         self.alpha: int = alpha
@@ -22,6 +30,53 @@ class Material(abc.ABC):
         The transparency of the material, where 0 is fully transparent and 255 is opaque.
         """
 
+        self._alpha_variants: OrderedDict[
+            tuple[pygame.Surface, int], pygame.Surface
+        ] = OrderedDict()
+
+    def _get_alpha_variant(self, surface: pygame.Surface, alpha: float) -> pygame.Surface:
+        """
+        Returns a copy of a surface that is drawn with the given transparency. The surface itself is never
+        modified, because it may be shared between elements. The most recently used copies are cached, so that
+        elements that fade together share them. Only used by render(), since draw() applies the alpha
+        while blitting instead.
+        """
+        alpha = int(alpha)
+        if alpha >= 255:
+            return surface
+
+        key = (surface, alpha)
+        if (variant := self._alpha_variants.get(key)) is not None:
+            self._alpha_variants.move_to_end(key)
+            return variant
+
+        variant = self._alpha_variants[key] = surface.copy()
+        variant.set_alpha(alpha)
+        if len(self._alpha_variants) > ALPHA_VARIANT_CACHE_SIZE:
+            self._alpha_variants.popitem(last=False)
+        return variant
+
+    @staticmethod
+    def _blit_with_alpha(
+        destination: pygame.Surface,
+        surface: pygame.Surface,
+        pos: tuple[float, float],
+        alpha: float,
+    ) -> None:
+        """
+        Blits a surface with the given transparency, without copying it. The alpha of the surface is
+        restored afterwards, so surfaces that are shared between elements are left unchanged.
+        """
+        alpha = int(alpha)
+        if alpha >= 255:
+            destination.blit(surface, pos)
+            return
+
+        previous_alpha = surface.get_alpha()
+        surface.set_alpha(alpha)
+        destination.blit(surface, pos)
+        surface.set_alpha(previous_alpha)
+
     @abc.abstractmethod
     def render(
         self,
@@ -54,10 +109,16 @@ class MaterialWithElementCache(Material):
 
     def __init__(self, alpha: int):
         self._cache: WeakKeyDictionary = WeakKeyDictionary()
+        # Surfaces that can be shared are only owned by the shared cache, so only their keys are kept here
+        self._shared_keys: WeakKeyDictionary = WeakKeyDictionary()
+        self._cache_version: int = new_cache_version()
         super().__init__(alpha)
 
     def clear_cache(self) -> None:
         self._cache.clear()
+        self._shared_keys.clear()
+        self._alpha_variants.clear()
+        self._cache_version = new_cache_version()
 
     def _needs_to_render(
         self,
@@ -69,7 +130,9 @@ class MaterialWithElementCache(Material):
         """
         Returns True if a surface needs to be rendered and cached.
         """
-        return element not in self._cache or self.get(element).get_size() != size
+        return (
+            cached_surface := self.get(element)
+        ) is None or cached_surface.get_size() != size
 
     def _render_surface(
         self,
@@ -83,54 +146,57 @@ class MaterialWithElementCache(Material):
         """
         pass
 
+    def _get_shared_cache_key(
+        self, element: "Element", size: tuple[float, float]
+    ) -> Optional[Hashable]:
+        """
+        Returns the key that the rendered surface is stored with in the cache shared between all materials,
+        or None if the surface depends on the element and so can't be shared.
+        """
+        return None
+
     def get(self, element: "Element") -> Optional[pygame.Surface]:
         """
-        Returns the cached surface for an element. None is returned if the surface is not yet cached.
+        Returns the cached surface for an element. None is returned if the surface is not yet cached,
+        or if it has been evicted from the shared cache.
         """
+        if (key := self._shared_keys.get(element)) is not None:
+            return shared_surface_cache.peek(key)
         return self._cache.get(element)
 
-    def render(
+    def _update_cache(
         self,
         element: "Element",
         surface: pygame.Surface,
         pos: tuple[int, int],
         size: tuple[int, int],
-        alpha: int,
-    ) -> Optional[pygame.Surface]:
+    ) -> pygame.Surface:
         """
-        Render the material to a surface, which is saved in a cache.
-        Returns True if the Surface needed to be re-rendered.
+        Render the material to a surface if the cached one is out of date, and return the cached surface.
         """
-        if self._needs_to_render(element, surface, pos, size):
+        if not self._needs_to_render(element, surface, pos, size):
+            return self.get(element)
+
+        key = self._get_shared_cache_key(element, size)
+        self._shared_keys.pop(element, None)
+        if key is None:
             log.material.info("Rendering...", element, self)
             self._cache[element] = self._render_surface(element, surface, pos, size)
+            return self.get(element)
 
-        new_surface = self.get(element)
-        new_surface.set_alpha(alpha * self.alpha / 255)
-
-        return new_surface
-
-
-class MaterialWithSizeCache(MaterialWithElementCache, abc.ABC):
-    """
-    Materials that have a size cache in addition to an element cache inherit from this class.
-    This base class should not be instantiated.
-    """
-
-    def __init__(self, alpha: int) -> None:
-        super().__init__(alpha)
-
-        self._size_cache_k: WeakKeyDictionary[
-            Element, tuple[float, float]
-        ] = WeakKeyDictionary()
-        self._size_cache_v: WeakValueDictionary[
-            tuple[float, float], Element
-        ] = WeakValueDictionary()
+        if (cached_surface := shared_surface_cache.get(key)) is not None:
+            log.material.info(f"Reusing size {size}...", element, self)
+        else:
+            log.material.info("Rendering...", element, self)
+            cached_surface = self._render_surface(element, surface, pos, size)
+            if not shared_surface_cache.put(key, cached_surface):
+                # The surface is too large for the shared cache, so the element keeps it instead
+                self._cache[element] = cached_surface
+                return cached_surface
 
-    def clear_cache(self) -> None:
-        self._cache.clear()
-        self._size_cache_v.clear()
-        self._size_cache_k.clear()
+        self._cache.pop(element, None)
+        self._shared_keys[element] = key
+        return cached_surface
 
     def render(
         self,
@@ -140,35 +206,40 @@ class MaterialWithSizeCache(MaterialWithElementCache, abc.ABC):
         size: tuple[int, int],
         alpha: int,
     ) -> Optional[pygame.Surface]:
-        if self._needs_to_render(element, surface, pos, size):
-            if size in self._size_cache_v:
-                log.material.info(f"Reusing size {size}...", element, self)
-                if self.get(self._size_cache_v[size]).get_size() != size:
-                    log.material.info("Rendering...", element, self)
-                    self._cache[element] = self._render_surface(
-                        element, surface, pos, size
-                    )
-
-                    other_element = self._size_cache_v[size]
-                    if other_element in self._size_cache_k:
-                        del self._size_cache_v[self._size_cache_k[other_element]]
-                        del self._size_cache_k[other_element]
-
-                    self._size_cache_v[size] = element
-                    self._size_cache_k[element] = size
-                else:
-                    self._cache[element] = self._cache[self._size_cache_v[size]]
-
-            else:
-                log.material.info("Rendering...", element, self)
-                self._cache[element] = self._render_surface(element, surface, pos, size)
-                if element in self._size_cache_k:
-                    del self._size_cache_v[self._size_cache_k[element]]
-
-                self._size_cache_v[size] = element
-                self._size_cache_k[element] = size
-
-        material_surface = self._cache[element]
-        material_surface.set_alpha(alpha * self.alpha / 255)
-        return material_surface
-    
\ No newline at end of file
+        """
+        Render the material to a surface, which is saved in a cache.
+        Returns the surface, with the alpha applied. The returned surface may be shared, and must not be modified.
+        """
+        return self._get_alpha_variant(
+            self._update_cache(element, surface, pos, size), alpha * self.alpha / 255
+        )
+
+    def draw(
+        self,
+        element: "Element",
+        surface: pygame.Surface,
+        pos: tuple[int, int],
+        size: tuple[int, int],
+        alpha: int,
+    ) -> None:
+        # The alpha is applied while blitting, so that fading elements don't copy the cached surface each frame
+        self._blit_with_alpha(
+            surface,
+            self._update_cache(element, surface, pos, size),
+            pos,
+            alpha * self.alpha / 255,
+        )
+
+
+class MaterialWithSizeCache(MaterialWithElementCache, abc.ABC):
+    """
+    Materials whose surfaces only depend on their size inherit from this class. Elements with the same
+    size share the same surface, through the surface cache that is shared between all materials. Only the
+    shared cache holds the surfaces, so its budget bounds the memory that they use.
+    This base class should not be instantiated.
+    """
+
+    def _get_shared_cache_key(
+        self, element: "Element", size: tuple[float, float]
+    ) -> Optional[Hashable]:
+        return self._cache_version, tuple(size)
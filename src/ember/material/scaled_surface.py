@@ -40,7 +40,9 @@ class ScaledSurface(MaterialWithSizeCache):
         pos: tuple[float, float],
         size: tuple[float, float],
     ) -> bool:
-        return element not in self._cache or self._cache[element].get_size() != size
+        return (
+            cached_surface := self.get(element)
+        ) is None or cached_surface.get_size() != size
 
     def _render_surface(
         self,
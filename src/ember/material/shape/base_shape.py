@@ -1,6 +1,6 @@
 import pygame
 import abc
-from typing import Optional, TYPE_CHECKING, Any
+from typing import Optional, TYPE_CHECKING, Any, Hashable
 
 if TYPE_CHECKING:
     from ember.ui.base.element import Element
@@ -51,15 +51,21 @@ class Shape(MaterialWithElementCache, abc.ABC):
         if self._material is not None:
             return (
                 self._material._needs_to_render(element, surface, pos, size)
-                or element not in self._cache
-                or self._cache.get(element).get_size() != size
+                or (cached_surface := self.get(element)) is None
+                or cached_surface.get_size() != size
             )
 
         elif self._color is not None:
             return (
-                element not in self._cache
-                or self._cache.get(element).get_size() != size
-            )
+                cached_surface := self.get(element)
+            ) is None or cached_surface.get_size() != size
+
+    def _get_shared_cache_key(
+        self, element: "Element", size: tuple[float, float]
+    ) -> Optional[Hashable]:
+        if self._material is not None:
+            return None
+        return self._cache_version, tuple(size)
 
     def _render_surface(
         self,
@@ -1,15 +1,15 @@
 import pygame
 import pygame.gfxdraw
 
+from ..surface_cache import shared_surface_cache
 
-def draw_circle(
-    surface: pygame.Surface,
-    pos: tuple[float, float],
-    radius: int,
-    antialias: bool,
-    outline: int,
-) -> None:
-    if antialias:
+# The antialiased circles, arcs and corners below are drawn once for each set of parameters and then
+# kept in the surface cache that is shared between all materials. The cached surfaces must not be modified.
+
+
+def _get_antialiased_circle(radius: int, outline: int) -> pygame.Surface:
+    key = ("circle", radius, outline)
+    if (circle := shared_surface_cache.get(key)) is None:
         scale = 4
         circle = pygame.Surface(
             (radius * scale * 2, radius * scale * 2), pygame.SRCALPHA
@@ -21,8 +21,59 @@ def draw_circle(
             radius * scale,
             outline * scale,
         )
+        circle = pygame.transform.smoothscale(circle, (radius * 2, radius * 2))
+        shared_surface_cache.put(key, circle)
+    return circle
+
+
+def _get_antialiased_arc(
+    radius: int, outline: int, start_angle: float, stop_angle: float
+) -> pygame.Surface:
+    key = ("arc", radius, outline, start_angle, stop_angle)
+    if (arc := shared_surface_cache.get(key)) is None:
+        scale = 4
+        arc = pygame.Surface((radius * scale * 2, radius * scale * 2), pygame.SRCALPHA)
+        pygame.draw.arc(
+            arc,
+            (0, 0, 0),
+            (0, 0, radius * scale * 2, radius * scale * 2),
+            start_angle,
+            stop_angle,
+            outline * scale,
+        )
+        arc = pygame.transform.smoothscale(arc, (radius * 2, radius * 2))
+        shared_surface_cache.put(key, arc)
+    return arc
+
+
+def get_corner(radius: int, antialias: bool, outline: int, angle: int) -> pygame.Surface:
+    """
+    Returns a surface containing a quarter of a circle. When :code:`angle` is 0, the corner is the bottom-right
+    quarter. Other angles rotate the corner anticlockwise, in multiples of 90 degrees.
+    """
+    key = ("corner", radius, antialias, outline, angle)
+    if (corner := shared_surface_cache.get(key)) is None:
+        if angle:
+            corner = pygame.transform.rotate(
+                get_corner(radius, antialias, outline, 0), angle
+            )
+        else:
+            corner = pygame.Surface((radius, radius), pygame.SRCALPHA)
+            draw_circle(corner, (0, 0), radius, antialias, outline)
+        shared_surface_cache.put(key, corner)
+    return corner
+
+
+def draw_circle(
+    surface: pygame.Surface,
+    pos: tuple[float, float],
+    radius: int,
+    antialias: bool,
+    outline: int,
+) -> None:
+    if antialias:
         surface.blit(
-            pygame.transform.smoothscale(circle, (radius * 2, radius * 2)),
+            _get_antialiased_circle(radius, outline),
             (pos[0] - radius, pos[1] - radius),
         )
     else:
@@ -53,20 +104,8 @@ def draw_arc(
 ) -> None:
     if outline:
         if antialias:
-            scale = 4
-            circle = pygame.Surface(
-                (radius * scale * 2, radius * scale * 2), pygame.SRCALPHA
-            )
-            pygame.draw.arc(
-                circle,
-                (0, 0, 0),
-                (0, 0, radius * scale * 2, radius * scale * 2),
-                start_angle,
-                stop_angle,
-                outline * scale,
-            )
             surface.blit(
-                pygame.transform.smoothscale(circle, (radius * 2, radius * 2)),
+                _get_antialiased_arc(radius, outline, start_angle, stop_angle),
                 (pos[0] - radius, pos[1] - radius),
             )
         else:
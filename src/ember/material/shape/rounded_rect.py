@@ -5,7 +5,7 @@ from .base_shape import Shape
 
 from ...common import ColorType
 
-from .draw_circle import draw_circle
+from .draw_circle import get_corner
 
 
 class RoundedRect(Shape):
@@ -23,7 +23,6 @@ class RoundedRect(Shape):
         super().__init__(material, color, antialias, outline)
 
         self._radius = radius
-        self._corner_surf: Optional[pygame.Surface] = None
         self.set_radius(radius)
 
     def __repr__(self) -> str:
@@ -34,28 +33,18 @@ class RoundedRect(Shape):
         else:
             return f"<RoundedRect>"
 
-    def _update_generic_surface(self) -> None:
-        self._corner_surf = pygame.Surface(
-            (self._radius, self._radius), pygame.SRCALPHA
-        )
-        draw_circle(
-            self._corner_surf, (0, 0), self._radius, self.antialias, self._outline
-        )
-        self.clear_cache()
-
     def _create_surface(self, size: tuple[float, float]) -> pygame.Surface:
         surface = pygame.Surface(size, pygame.SRCALPHA)
 
+        # The corners are shared between all RoundedRects with the same radius, antialias and outline
+        radius, antialias, outline = self._radius, self._antialias, self._outline
         surface.blit(
-            self._corner_surf, (size[0] - self._radius, size[1] - self._radius)
-        )
-        surface.blit(
-            pygame.transform.rotate(self._corner_surf, 90), (size[0] - self._radius, 0)
-        )
-        surface.blit(pygame.transform.rotate(self._corner_surf, 180), (0, 0))
-        surface.blit(
-            pygame.transform.rotate(self._corner_surf, 270), (0, size[1] - self._radius)
+            get_corner(radius, antialias, outline, 0),
+            (size[0] - radius, size[1] - radius),
         )
+        surface.blit(get_corner(radius, antialias, outline, 90), (size[0] - radius, 0))
+        surface.blit(get_corner(radius, antialias, outline, 180), (0, 0))
+        surface.blit(get_corner(radius, antialias, outline, 270), (0, size[1] - radius))
 
         if self._outline:
             offset = self._outline / 2
@@ -3,7 +3,7 @@ from functools import partial
 from typing import Union, Sequence, Optional, Any, TYPE_CHECKING
 from os import PathLike, fspath
 
-from ..utility.stretch_surface import stretch_surface
+from ..utility.stretch_surface import NineSlice
 from .material import MaterialWithSizeCache
 
 if TYPE_CHECKING:
@@ -34,6 +34,7 @@ class StretchedSurface(MaterialWithSizeCache):
         """
         (left, right, top, bottom). The number of pixels from each side that should be kept intact.
         """
+        self._nine_slice: Optional[NineSlice] = None
 
     def load_surface(self, surface: Union[str, pygame.Surface, PathLike]) -> None:
         if isinstance(surface, pygame.Surface):
@@ -53,7 +54,9 @@ class StretchedSurface(MaterialWithSizeCache):
         pos: tuple[float, float],
         size: tuple[float, float],
     ) -> bool:
-        return element not in self._cache or self._cache[element].get_size() != size
+        return (
+            cached_surface := self.get(element)
+        ) is None or cached_surface.get_size() != size
 
     def _render_surface(
         self,
@@ -62,7 +65,10 @@ class StretchedSurface(MaterialWithSizeCache):
         pos: tuple[float, float],
         size: tuple[float, float],
     ) -> Any:
-        return stretch_surface(self.surface, size, self.edge)
+        # The surface is sliced once and reused for every size, until the surface or edge changes
+        if self._nine_slice is None or self._nine_slice.surface is not self.surface:
+            self._nine_slice = NineSlice(self.surface, self._edge)
+        return self._nine_slice.stretch(size)
 
     @property
     def edge(self) -> Sequence[int]:
@@ -71,4 +77,5 @@ class StretchedSurface(MaterialWithSizeCache):
     @edge.setter
     def edge(self, value: Sequence[int]):
         self._edge = value
+        self._nine_slice = None
         self.clear_cache()
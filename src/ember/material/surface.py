@@ -40,13 +40,14 @@ class Surface(Material):
         alpha: int,
     ) -> Optional[pygame.Surface]:
         new_surface = pygame.Surface(size, pygame.SRCALPHA)
-        self.surface.set_alpha(alpha)
-        new_surface.blit(
+        self._blit_with_alpha(
+            new_surface,
             self.surface,
             (
                 size[0] // 2 - self.surface.get_width() // 2,
                 size[1] // 2 - self.surface.get_height() // 2,
             ),
+            alpha,
         )
         return new_surface
 
@@ -58,12 +59,13 @@ class Surface(Material):
         size: tuple[int, int],
         alpha: int,
     ) -> bool:
-        self.surface.set_alpha(alpha)
-        surface.blit(
+        self._blit_with_alpha(
+            surface,
             self.surface,
             (
                 pos[0] + size[0] // 2 - self.surface.get_width() // 2,
                 pos[1] + size[1] // 2 - self.surface.get_height() // 2,
             ),
+            alpha,
         )
         return False
@@ -0,0 +1,158 @@
+import pygame
+import itertools
+from collections import OrderedDict
+from typing import Hashable, NamedTuple, Optional
+
+from .. import log
+
+
+class CacheStats(NamedTuple):
+    hits: int
+    """
+    The number of times a surface was found in the cache.
+    """
+    misses: int
+    """
+    The number of times a surface wasn't found in the cache and had to be rendered.
+    """
+    evictions: int
+    """
+    The number of surfaces that were removed from the cache to stay within the budget.
+    """
+    entries: int
+    """
+    The number of surfaces currently in the cache.
+    """
+    bytes: int
+    """
+    The memory used by the surfaces currently in the cache, in bytes.
+    """
+    max_bytes: int
+    """
+    The memory budget of the cache, in bytes.
+    """
+
+
+class SurfaceCache:
+    """
+    A least-recently-used cache of rendered material surfaces, shared between all materials.
+    When the total size of the cached surfaces exceeds :code:`max_bytes`, the least recently used
+    surfaces are evicted. Used internally by the library.
+    """
+
+    def __init__(self, max_bytes: int) -> None:
+        self.max_bytes: int = max_bytes
+        self._surfaces: OrderedDict[Hashable, pygame.Surface] = OrderedDict()
+        self._bytes: int = 0
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+
+    def __repr__(self) -> str:
+        return f"<SurfaceCache({len(self._surfaces)} surfaces, {self._bytes} bytes)>"
+
+    def __len__(self) -> int:
+        return len(self._surfaces)
+
+    @staticmethod
+    def _get_surface_bytes(surface: pygame.Surface) -> int:
+        return surface.get_pitch() * surface.get_height()
+
+    def get(self, key: Hashable) -> Optional[pygame.Surface]:
+        """
+        Returns the surface cached with a key, or None if no surface is cached with that key.
+        """
+        surface = self._surfaces.get(key)
+        if surface is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._surfaces.move_to_end(key)
+        return surface
+
+    def peek(self, key: Hashable) -> Optional[pygame.Surface]:
+        """
+        Same as :py:meth:`get`, but the lookup isn't counted as a hit or a miss. Used to fetch a surface
+        that an element is already drawing.
+        """
+        if (surface := self._surfaces.get(key)) is not None:
+            self._surfaces.move_to_end(key)
+        return surface
+
+    def put(self, key: Hashable, surface: pygame.Surface) -> bool:
+        """
+        Cache a surface with a key, evicting other surfaces if necessary.
+        Returns False if the surface is larger than the whole budget, in which case it isn't cached.
+        """
+        if (old_surface := self._surfaces.pop(key, None)) is not None:
+            self._bytes -= self._get_surface_bytes(old_surface)
+
+        size = self._get_surface_bytes(surface)
+        if size > self.max_bytes:
+            return False
+
+        self._surfaces[key] = surface
+        self._bytes += size
+        self._evict()
+        return True
+
+    def _evict(self) -> None:
+        while self._bytes > self.max_bytes:
+            _, surface = self._surfaces.popitem(last=False)
+            self._bytes -= self._get_surface_bytes(surface)
+            self._evictions += 1
+            log.material.info(f"Evicted {surface} from the shared surface cache.")
+
+    def set_max_bytes(self, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self._evict()
+
+    def clear(self) -> None:
+        self._surfaces.clear()
+        self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            self._hits,
+            self._misses,
+            self._evictions,
+            len(self._surfaces),
+            self._bytes,
+            self.max_bytes,
+        )
+
+
+DEFAULT_CACHE_BUDGET = 64 * 1024 * 1024
+
+shared_surface_cache = SurfaceCache(DEFAULT_CACHE_BUDGET)
+
+# Each material takes a new number from this counter whenever its cache is cleared, so stale
+# surfaces in the shared cache can never be matched, even if the material object is garbage collected
+_cache_versions = itertools.count()
+
+
+def new_cache_version() -> int:
+    return next(_cache_versions)
+
+
+def cache_stats() -> CacheStats:
+    """
+    Returns statistics about the surface cache that is shared between all materials.
+    """
+    return shared_surface_cache.stats()
+
+
+def set_cache_budget(max_bytes: int) -> None:
+    """
+    Set the maximum amount of memory, in bytes, that the shared material surface cache can use.
+    The default is 64 MiB. Materials don't keep their own references to shared surfaces, so surfaces that
+    are evicted are freed, and are rendered again the next time an element draws them.
+    """
+    shared_surface_cache.set_max_bytes(max_bytes)
+
+
+def clear_shared_cache() -> None:
+    """
+    Remove all surfaces from the surface cache that is shared between all materials.
+    """
+    shared_surface_cache.clear()
@@ -30,6 +30,9 @@ class AbsolutePosition(Position):
             return self.value == other.value
         return False
 
+    def __hash__(self) -> int:
+        return hash(self.value)
+
     def __add__(self, other):
         if isinstance(other, (int, float)):
             return type(self)(self.value + other)
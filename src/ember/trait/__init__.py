@@ -3,3 +3,4 @@ from .trait import Trait
 from .trait_context import TraitContext
 from . import trait_layer
 from .trait_layer import TraitLayer
+from .trait_batch import batch
@@ -1,62 +1,96 @@
-from typing import TYPE_CHECKING, Sequence
+from typing import TYPE_CHECKING, Sequence, Hashable
 
 if TYPE_CHECKING:
     from ember.ui.container import Container
 
 from .trait import Trait, TraitReference
 from .cascading_trait_value import CascadingTraitValue
+from .conditional_cascading_trait_value import ConditionalCascadingTraitValue
 
 from ember import log
 
 class CascadeRepository:
-    __slots__ = ("element", "values")
-    
+    __slots__ = ("element", "values", "_conditional")
+
     def __init__(self, element: "Container", values: Sequence[CascadingTraitValue]) -> None:
         self.element: "Container" = element
-        self.values: list[CascadingTraitValue] = []
+        # Values are stored by reference, so that adding a value for the same trait replaces the old one.
+        # Conditional values don't know their reference until they descend, so they are stored by owner and
+        # function, and replaced by reference once they have descended.
+        self.values: dict[Hashable, CascadingTraitValue] = {}
+        self._conditional: dict[Hashable, ConditionalCascadingTraitValue] = {}
         for i in values:
             self.add(i)
-            
+
     def __iter__(self):
-        return iter(self.values)
-    
+        return iter(self.values.values())
+
+    def __len__(self) -> int:
+        return len(self.values)
+
     def __contains__(self, ref: TraitReference) -> bool:
-        return any(i.ref == ref for i in self.values)
-        
+        if ref in self.values:
+            return True
+        return any(i.ref == ref for i in self._conditional.values())
+
     def __getitem__(self, key: Trait) -> CascadingTraitValue:
         ref = key.create_reference()
-        for value in self.values:
-            if value.ref == ref:
-                return value
+        if (value := self.values.get(ref)) is not None:
+            return value
         return CascadingTraitValue(ref=ref, value=key.default_value, depth=key.default_cascade_depth)
-    
+
     def __setitem__(self, key: Trait, value: CascadingTraitValue) -> None:
-        ref = key.create_reference()
         if key != value.ref.trait:
             raise ValueError("CascadingTraitValue doesn't match key")
-        
-        for n,i in enumerate(self.values):
-            if i.ref == ref:
-                del self.values[n]
-                break
-            
-        self.values.append(value)
+
+        self._store(value)
         self.element.start_cascade(value)
-        
+        self._replace_conditional(value)
+
     def __delitem__(self, key: Trait) -> None:
         ref = key.create_reference()
-        for n,value in enumerate(self.values):
+        removed = []
+        if (value := self.values.pop(ref, None)) is not None:
+            removed.append(value)
+        for conditional_key, value in list(self._conditional.items()):
             if value.ref == ref:
-                del self.values[n]
-                self.element.start_cascade(
-                    CascadingTraitValue(
-                        trait=value.trait,
-                        alue=None,
-                        depth=value.depth
-                    )
+                del self._conditional[conditional_key]
+                del self.values[conditional_key]
+                removed.append(value)
+
+        for value in removed:
+            self.element.start_cascade(
+                CascadingTraitValue(
+                    ref=value.ref,
+                    value=None,
+                    depth=value.depth
                 )
-               
+            )
+
+    def _store(self, value: CascadingTraitValue) -> None:
+        if isinstance(value, ConditionalCascadingTraitValue):
+            key = (value.owner, value.func)
+            self._conditional[key] = value
+        else:
+            key = value.ref
+        # Re-inserting moves the value to the end, so that it is still applied last
+        self.values.pop(key, None)
+        self.values[key] = value
+
+    def _replace_conditional(self, value: CascadingTraitValue) -> None:
+        """
+        Remove the conditional values that descended as the same reference as a conditional value that has just
+        descended, so that a new conditional value for a trait replaces the old one.
+        """
+        if not isinstance(value, ConditionalCascadingTraitValue):
+            return
+        for key, other in list(self._conditional.items()):
+            if other is not value and other.ref == value.ref:
+                del self._conditional[key]
+                del self.values[key]
+
     def add(self, value: CascadingTraitValue) -> None:
         with log.cascade.indent(f"Value added to {self.element}..."):
-            self.values.append(value)
-            self.element.start_cascade(value)
\ No newline at end of file
+            self._store(value)
+            self.element.start_cascade(value)
+            self._replace_conditional(value)
@@ -56,15 +56,17 @@ class Trait(BaseTrait[T]):
         return f"<Trait('{self.name}')>"
 
     def __get__(self, instance: "Element", owner: Type["Element"]) -> T:
-        # We can't just use the 'element_type' instance attr for this because of inheritance
-        BaseTrait.inspected_class = owner
         if instance is None:
+            # The class is only needed when the trait itself is accessed, to create cascading values or
+            # change default values. We can't just use the 'element_type' instance attr for this because of inheritance
+            BaseTrait.inspected_class = owner
             return self
-        context = getattr(instance, self.context_name, None)
-        if context is None:
-            context = TraitContext(instance, self)
-            setattr(instance, self.context_name, context)            
-        return context.value
+        try:
+            return instance.__dict__[self.context_name].value
+        except KeyError:
+            # Elements create their trait contexts in advance, but other classes can still use traits
+            context = instance.__dict__[self.context_name] = TraitContext(instance, self)
+            return context.value
 
     def __set__(self, instance: "Element", value: T) -> None:
         value = self.load_value(value)
@@ -72,11 +74,10 @@ class Trait(BaseTrait[T]):
         log.trait.info(
             f"Setting {instance.__class__.__name__}.{self.context_name} value to {value}"
         )
-        context: TraitContext = getattr(instance, self.context_name, None)
-
-        if context is None:
-            context = TraitContext(instance, self)
-            setattr(instance, self.context_name, context)
+        try:
+            context: TraitContext = instance.__dict__[self.context_name]
+        except KeyError:
+            context = instance.__dict__[self.context_name] = TraitContext(instance, self)
 
         context.set_value(value)
 
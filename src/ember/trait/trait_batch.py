@@ -0,0 +1,70 @@
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Iterator
+
+if TYPE_CHECKING:
+    from .trait_context import TraitContext
+    from ember.ui.element import Element
+
+_depth: int = 0
+_pending_callbacks: dict["TraitContext", None] = {}
+_pending_min_size: dict["Element", bool] = {}
+
+
+def is_batching() -> bool:
+    """
+    Returns True if trait callbacks are currently being deferred by :py:func:`batch<ember.trait.batch>`.
+    """
+    return _depth > 0
+
+
+def defer_callbacks(context: "TraitContext") -> None:
+    """
+    Record that the callbacks of a trait context need to be sent when the outermost batch exits.
+    """
+    _pending_callbacks[context] = None
+
+
+def defer_min_size_update(element: "Element", must_update_parent: bool) -> None:
+    """
+    Record that an element needs to be queued for a min size update when the outermost batch exits.
+    """
+    _pending_min_size[element] = _pending_min_size.get(element, False) or must_update_parent
+
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    A context manager that defers trait callbacks until the block exits. Trait values are still
+    updated immediately, but each trait's on_update callbacks are sent at most once per element,
+    and each modified element is queued for layout once, however many of its traits were set.
+    Batches can be nested, in which case everything is sent when the outermost batch exits.
+    """
+    global _depth
+    _depth += 1
+    try:
+        yield
+    finally:
+        if _depth == 1:
+            try:
+                _send_pending_callbacks()
+            finally:
+                _depth = 0
+            _queue_pending_min_size_updates()
+        else:
+            _depth -= 1
+
+
+def _send_pending_callbacks() -> None:
+    global _pending_callbacks
+    # Callbacks may set more traits, whose callbacks are deferred again and sent on the next pass
+    while _pending_callbacks:
+        pending, _pending_callbacks = _pending_callbacks, {}
+        for context in pending:
+            context._send_own_callbacks()
+
+
+def _queue_pending_min_size_updates() -> None:
+    global _pending_min_size
+    pending, _pending_min_size = _pending_min_size, {}
+    for element, must_update_parent in pending.items():
+        element.update_min_size_next_tick(must_update_parent=must_update_parent)
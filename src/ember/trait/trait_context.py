@@ -3,6 +3,7 @@ from typing import TypeVar, Generic, Optional, TYPE_CHECKING, Union
 from ..animation import Animation
 from .trait_layer import TraitLayer
 from . import trait_layer
+from . import trait_batch
 
 if TYPE_CHECKING:
     from .trait_value import TraitValue
@@ -93,6 +94,8 @@ class TraitContext(Generic[T]):
                 if c.trait_context is self:
                     c._finish()
                     self._element._animation_contexts.remove(c)
+                    if c.scheduler is not None:
+                        c.scheduler.discard(c)
                     self.update()
                     break
 
@@ -100,6 +103,7 @@ class TraitContext(Generic[T]):
                 context = anim.create_context(self, old_val, self.value)
 
                 self._element._animation_contexts.append(context)
+                self._element._schedule_animation(context)
                 val = context.target._get_value(context)
                 self.animation_value = val
                 self.value = val
@@ -133,9 +137,16 @@ class TraitContext(Generic[T]):
 
     def send_callbacks(self) -> None:
         if self._element._has_built:
-            for call in self.trait.on_update:
-                call(self._element)
+            if trait_batch._depth:
+                trait_batch.defer_callbacks(self)
+            else:
+                self._send_own_callbacks()
 
             for child in self._children:
                 child.update()
                 child.send_callbacks()
+
+    def _send_own_callbacks(self) -> None:
+        if self._element._has_built:
+            for call in self.trait.on_update:
+                call(self._element)
@@ -26,3 +26,5 @@ from .switch import Switch
 from .h_stack import HStack
 from .v_stack import VStack
 from .z_stack import ZStack
+
+from .list_view import ListView
@@ -57,8 +57,7 @@ class Box(SingleElementContainer[T], FocusPassthrough):
         return False
 
     def update_can_focus(self) -> None:
-        if self in self.layer.can_focus_update_queue:
-            self.layer.can_focus_update_queue.remove(self)
+        self.layer.can_focus_update_queue.discard(self)
         if self._can_focus != (v := self._element and self._element._can_focus):
             self._can_focus = v
             log.nav.info(f"Changed can_focus to {self._can_focus}.", self)
@@ -42,7 +42,7 @@ class CanHandleFocusChildDependent(CanHandleFocus, Container, ABC):
         """
 
     def _build(self) -> None:
-        self.layer.can_focus_update_queue.append(self)
+        self.layer.can_focus_update_queue.add(self)
         super()._build()
 
     @contextmanager
@@ -53,16 +53,14 @@ class CanHandleFocusChildDependent(CanHandleFocus, Container, ABC):
             yield element
 
         if self._has_built and update:
-            if self not in self.layer.can_focus_update_queue:
-                self.layer.can_focus_update_queue.append(self)
+            self.layer.can_focus_update_queue.add(self)
 
     def removing_element(
         self, element: Optional["Element"], update: bool = True
     ) -> None:
         super().removing_element(element, update)
         if self._has_built and update:
-            if self not in self.layer.can_focus_update_queue:
-                self.layer.can_focus_update_queue.append(self)
+            self.layer.can_focus_update_queue.add(self)
 
 
 class CanFocus(CanHandleFocus):
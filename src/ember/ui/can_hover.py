@@ -3,8 +3,6 @@ from typing import TYPE_CHECKING
 from ember.ui.element import Element
 from ember.event import HOVERED, UNHOVERED
 
-from ember import common as _c
-
 if TYPE_CHECKING:
     pass
 
@@ -14,16 +12,29 @@ class CanHover(Element):
         self._hovered: bool = False
         super().__init__(*args, **kwargs)
 
-    def _update(self) -> None:
-        if (hovered := self.rect.collidepoint(_c.mouse_pos)) != self._hovered:
-            self._hovered = hovered
-            if hovered:
+    def update_rect(self, *args, **kwargs) -> None:
+        super().update_rect(*args, **kwargs)
+        # The ViewLayer uses its hover index to find which elements are under the mouse
+        if self.layer is not None:
+            if self.visible:
+                self.layer.hover_index.update(self, self.rect)
+            else:
+                self.layer._remove_hoverable(self)
+
+    def update_ancestry(self, ancestry: list["Element"]) -> None:
+        if self.layer is not None and (not ancestry or ancestry[-1].layer is not self.layer):
+            self.layer._remove_hoverable(self)
+        super().update_ancestry(ancestry)
+
+    def _set_hovered(self, value: bool) -> None:
+        if value != self._hovered:
+            self._hovered = value
+            self.mark_dirty()
+            if value:
                 self._post_event(HOVERED)
             else:
                 self._post_event(UNHOVERED)
 
-        super()._update()
-
     @property
     def hovered(self) -> bool:
         return self._hovered
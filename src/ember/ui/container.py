@@ -44,16 +44,35 @@ class Container(ContextManager, Element, ABC, metaclass=ContainerMeta):
 
     text_class: Type["Text"] = Text
 
+    cache_render: bool = Trait(
+        False, on_update=lambda self: self.invalidate_render_cache()
+    )
+    """
+    When :code:`True`, the Container renders its child elements once into an offscreen surface, and
+    blits that surface every tick until one of the child elements changes. This is useful for large
+    Containers whose contents rarely change. If a child element changes every tick, caching is switched off
+    for the Container automatically. While a child element draws a material that updates every tick or reads
+    the surface behind it (such as :py:class:`Blur<ember.material.Blur>`), the cache is bypassed.
+    """
+
+    _render_cache_valid: bool = False
+
     def __init__(
         self,
         *args,
         cascading: Union[CascadingTraitValue, Sequence[CascadingTraitValue]] = (),
+        cache_render: Optional[bool] = None,
         **kwargs,
     ) -> None:
+        # The children that each cascading value owner type applies to, rebuilt when the children change
+        self._cascade_targets: dict[type, tuple[Element, ...]] = {}
         self.cascading: CascadeRepository = CascadeRepository(
             self,
             (cascading,) if isinstance(cascading, CascadingTraitValue) else cascading,
         )
+        self._render_cache: Optional[pygame.Surface] = None
+        self._render_cache_disabled: bool = False
+        self.cache_render = cache_render
         super().__init__(*args, **kwargs)
         
     def _build(self) -> None:
@@ -66,16 +85,77 @@ class Container(ContextManager, Element, ABC, metaclass=ContainerMeta):
 
     def _prepare_element(self, element: Element) -> None:
         for value in self.cascading:
-            self.start_cascade(value)
-            
+            with log.cascade.indent(f"Starting descent for {value}", self):
+                value.prepare_for_descent(self)
+                element.update_cascading_value(value, value.depth)
+
     def start_cascade(self, value: CascadingTraitValue) -> None:
         with log.cascade.indent(f"Starting descent for {value}", self):
             with Trait.inspecting(Trait.Layer.PARENT):
                 value.prepare_for_descent(self)
-                for element in self._elements_to_render:
-                    element.update_cascading_value(value, value.depth)
-        log.cascade.line_break() 
-        
+                self._cascade_to_children(value, value.depth)
+        log.cascade.line_break()
+
+    def _cascade_to_children(self, value: CascadingTraitValue, depth: int) -> None:
+        if depth != 1:
+            # The value has to pass through every child container to reach deeper elements
+            targets = self._elements_to_render
+        elif (targets := self._cascade_targets.get(value.ref.owner)) is None:
+            targets = self._cascade_targets[value.ref.owner] = tuple(
+                i for i in self._elements_to_render if isinstance(i, value.ref.owner)
+            )
+        for element in targets:
+            if element is not None:
+                element.update_cascading_value(value, depth)
+
+    def render(
+        self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
+    ) -> None:
+        if (
+            not self.cache_render
+            or self._render_cache_disabled
+            or (not self._render_cache_valid and self._reads_surface())
+        ):
+            # Materials that read the surface behind them would read the empty cache instead
+            self._render(surface, offset, alpha=alpha)
+            return
+
+        size = self._int_rect.size
+        if self._render_cache is None or self._render_cache.get_size() != size:
+            self._render_cache = pygame.Surface(size, pygame.SRCALPHA)
+            self._render_cache_valid = False
+
+        if not self._render_cache_valid:
+            log.material.info("Rendering subtree to cache...", self)
+            self._render_cache.fill((0, 0, 0, 0))
+            self._render_cache_valid = True
+            # Children draw into the surface they are given, so moving them by the offset draws them into the cache
+            self._render(
+                self._render_cache, (-self._int_rect.x, -self._int_rect.y), alpha=255
+            )
+            if not self._render_cache_valid:
+                # A child element changed while being rendered, so it will change every tick
+                log.material.info("Subtree changes every tick, disabling cache.", self)
+                self._render_cache_disabled = True
+
+        self._render_cache.set_alpha(alpha)
+        surface.blit(
+            self._render_cache,
+            (
+                self._int_rect.x + offset[0] - surface.get_abs_offset()[0],
+                self._int_rect.y + offset[1] - surface.get_abs_offset()[1],
+            ),
+        )
+
+    def invalidate_render_cache(self) -> None:
+        """
+        Re-render the cached subtree on the next tick, and allow caching again if it was switched off.
+        Only needs to be called manually if you modify a material in-place.
+        """
+        self._render_cache = None
+        self._render_cache_valid = False
+        self._render_cache_disabled = False
+
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
@@ -83,6 +163,9 @@ class Container(ContextManager, Element, ABC, metaclass=ContainerMeta):
             if i is not None:
                 i.render(surface, offset, alpha=alpha)
 
+    def _reads_surface(self) -> bool:
+        return any(i._reads_surface() for i in self._elements_to_render if i is not None)
+
     def _update(self) -> None:
         super()._update()
         for i in self._elements_to_render:
@@ -139,10 +222,14 @@ class Container(ContextManager, Element, ABC, metaclass=ContainerMeta):
         if depth == 0:
             return
         with log.cascade.indent():
-            for element in self._elements_to_render:
-                element.update_cascading_value(value, depth)
+            self._cascade_to_children(value, depth)
                 
 
+    def copy(self) -> "Element":
+        new = super().copy()
+        new._cascade_targets = {}
+        return new
+
     @property
     @abstractmethod
     def _elements_to_render(self) -> Iterable[Element]:
@@ -171,6 +258,7 @@ class Container(ContextManager, Element, ABC, metaclass=ContainerMeta):
                 f"Tried to add a container ({self}) as a child element of itself, which isn't allowed."
             )
         yield element
+        self._cascade_targets.clear()
 
         if self._has_built:
             if element is not None:
@@ -184,11 +272,13 @@ class Container(ContextManager, Element, ABC, metaclass=ContainerMeta):
     def removing_element(
         self, element: Optional["Element"], update: bool = True
     ) -> None:
+        self._cascade_targets.clear()
         if element is not None:
-            element.update_ancestry([])
-            if self.layer is not None:
-                if self.layer.element_focused is element:
+            # The focused element has to be unfocused while it is still inside the layer
+            if self.layer is not None and (focused := self.layer.element_focused) is not None:
+                if focused is element or element in focused.ancestry:
                     self.layer._focus_element(None)
+            element.update_ancestry([])
         if self._has_built and update:
             self.update_min_size_next_tick()
             self.update_rect_next_tick()
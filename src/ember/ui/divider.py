@@ -22,7 +22,9 @@ def load_material(material: Union[Material, ColorType, None]) -> Material:
 
 class Divider(Element):
     material = Trait(
-        default_value=DEFAULT_BLACK_MATERIAL, load_value_with=load_material
+        default_value=DEFAULT_BLACK_MATERIAL,
+        on_update=lambda self: self.mark_dirty(),
+        load_value_with=load_material,
     )
 
     def __init__(
@@ -47,10 +49,17 @@ class Divider(Element):
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
-        rect = self.rect.move([-i for i in surface.get_abs_offset()])
+        rect = self.rect.move(
+            offset[0] - surface.get_abs_offset()[0], offset[1] - surface.get_abs_offset()[1]
+        )
         if self.material is not None:
             self.material.draw(self, surface, rect.topleft, rect.size, alpha)
 
+    def _reads_surface(self) -> bool:
+        return self.material is not None and (
+            self.material.UPDATES_EVERY_TICK or self.material.READS_SURFACE
+        )
+
     def update_ancestry(self, ancestry: list["Element"]) -> None:
         super().update_ancestry(ancestry)
         self._axis = 1 - self.parent._axis
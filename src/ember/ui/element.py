@@ -21,7 +21,7 @@ from ember.position import (
     CENTER,
 )
 
-from ember.trait import Trait
+from ember.trait import Trait, TraitContext, trait_batch
 from ember.size import load_size
 from ember.position import load_position
 from ember.trait.cascading_trait_value import CascadingTraitValue
@@ -106,6 +106,13 @@ class Element(abc.ABC, metaclass=ElementMeta):
     _callback_registry: CallbackRegistry = CallbackRegistry()
     _instances = WeakSet()
 
+    intercepts_mouse: bool = False
+    """
+    If :code:`True`, the element handles mouse button events before its child elements do,
+    so mouse button events inside it are passed down the element tree rather than directly
+    to the hovered element.
+    """
+
     # ----------------------------
 
     def _geometry_trait_modified(self, trait_name: str) -> None:
@@ -145,6 +152,10 @@ class Element(abc.ABC, metaclass=ElementMeta):
     def __new__(cls, *args, **kwargs):
         instance = super().__new__(cls)
         cls._instances.add(instance)
+        # Trait contexts are created up front, so that reading a trait never has to check for them
+        contexts = instance.__dict__
+        for trait in cls._trait_layout:
+            contexts[trait.context_name] = TraitContext(instance, trait)
         return instance
 
     def __init__(
@@ -273,14 +284,11 @@ class Element(abc.ABC, metaclass=ElementMeta):
                 f"Missing value for updated element geometry - ({x}, {y}, {w}, {h})"
             )
 
-        if self in self.layer.rect_update_queue:
+        if self.layer.rect_update_queue.discard(self):
             log.size.info(
-                "Element is queued for update but recieved an update first, removing from list.",
+                "Element is queued for update but recieved an update first, removing from queue.",
                 self,
             )
-            self.layer.rect_update_queue = list(
-                filter(lambda a: a is not self, self.layer.rect_update_queue)
-            )
 
         if self.w.relies_on_other_value:
             if h != self.rect.h:
@@ -288,6 +296,7 @@ class Element(abc.ABC, metaclass=ElementMeta):
                     f"Height was changed and width calculation relies on height, queueing...",
                     self,
                 )
+                self.mark_dirty()
                 self.rect.update(x, y, w, h)
                 self.update_rect_next_tick()
                 return
@@ -298,6 +307,7 @@ class Element(abc.ABC, metaclass=ElementMeta):
                     f"Width was changed and height calculation relies on width, queueing...",
                     self,
                 )
+                self.mark_dirty()
                 self.rect.update(x, y, w, h)
                 self.update_rect_next_tick()
                 return
@@ -306,6 +316,9 @@ class Element(abc.ABC, metaclass=ElementMeta):
             log.size.info("Size didn't change, cutting chain...")
             return
 
+        rect_changed = self.rect != (x, y, w, h)
+        if rect_changed:
+            self.mark_dirty()
         self.rect.update(x, y, w, h)
         self._int_rect.update(
             int(x),
@@ -313,6 +326,8 @@ class Element(abc.ABC, metaclass=ElementMeta):
             int(w),
             int(h),
         )
+        if rect_changed:
+            self.mark_dirty()
 
         prev_axis = axis.axis
         axis.axis = self._axis
@@ -328,19 +343,33 @@ class Element(abc.ABC, metaclass=ElementMeta):
     ) -> None:
         pass
 
+    def _reads_surface(self) -> bool:
+        """
+        Returns True if the element draws a material that updates every tick or reads the surface that
+        it is drawn onto. Containers don't render such elements into their render cache.
+        """
+        return False
+
+    def mark_dirty(self) -> None:
+        """
+        Mark the area covered by the element as changed. The area will be included in the list of
+        dirty rects returned by the next :py:meth:`View.update<ember.ui.View.update>` call, and
+        any cached render of the element's ancestors will be discarded.
+        """
+        for ancestor in self.ancestry:
+            ancestor._render_cache_valid = False
+        if self.layer is not None and self.rect.w > 0 and self.rect.h > 0:
+            self.layer.add_dirty_rect(self.rect)
+
     def update_rect_next_tick(self) -> None:
         """
         On the next view update, call update_rect for this element.
         """
-        if (
-            self.layer is not None
-            and self.parent is not None
-            and self.parent not in self.layer.rect_update_queue
-        ):
-            log.size.info(
-                f"Queued parent {self.parent} for rect update next tick.", self
-            )
-            self.layer.rect_update_queue.append(self.parent)
+        if self.layer is not None and self.parent is not None:
+            if self.layer.rect_update_queue.add(self.parent):
+                log.size.info(
+                    f"Queued parent {self.parent} for rect update next tick.", self
+                )
         else:
             log.size.info("No layer - could not queue rect update.", self)
 
@@ -348,9 +377,12 @@ class Element(abc.ABC, metaclass=ElementMeta):
         """
         On the next view update, call update_min_size for this element.
         """
-        if self.layer is not None and self not in self.layer.min_size_update_queue:
-            log.size.info("Queued for min size update next tick.", self)
-            self.layer.min_size_update_queue.append((self, must_update_parent))
+        if trait_batch._depth:
+            # Inside ember.batch(), the element is queued once when the batch exits
+            trait_batch.defer_min_size_update(self, must_update_parent)
+        elif self.layer is not None:
+            if self.layer.min_size_update_queue.add(self, must_update_parent):
+                log.size.info("Queued for min size update next tick.", self)
         else:
             log.size.info("No layer - could not queue min size update.", self)
 
@@ -430,8 +462,14 @@ class Element(abc.ABC, metaclass=ElementMeta):
             if self.parent is not None:
                 self.update_rect_next_tick()
 
-                with log.size.indent(f"-> parent."):
-                    self.parent.update_min_size()
+                if self.layer is not None and self.layer.min_size_update_queue:
+                    # Other queued elements may share the parent, so the parent is queued and only updated
+                    # once, after all of them. The queue is processed deepest first.
+                    if self.layer.min_size_update_queue.add(self.parent):
+                        log.size.info("-> parent queued for min size update.", self)
+                else:
+                    with log.size.indent(f"-> parent."):
+                        self.parent.update_min_size()
             else:
                 log.size.info("No parent - cutting chain...", self)
 
@@ -453,25 +491,46 @@ class Element(abc.ABC, metaclass=ElementMeta):
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
         """
-        Used intenally by the library.
+        Used intenally by the library. Elements must only draw into the given surface, with their rect moved
+        by the given offset, because Containers with :code:`cache_render` render their children into an
+        offscreen surface.
         """
 
     def update(self) -> None:
         """
         Used internally by the library. Updates the element, with transitions taken into consideration.
         """
-        for anim_context in self._animation_contexts[:]:
-            if anim_context._update():
-                anim_context._finish()
-                self._animation_contexts.remove(anim_context)
+        if self._animation_contexts:
+            # Animations are usually advanced by the View's AnimationScheduler instead
+            for anim_context in self._animation_contexts[:]:
+                if anim_context.scheduler is None and anim_context._update():
+                    anim_context._finish()
+                    self._animation_contexts.remove(anim_context)
         self._update()
 
+    def _schedule_animation(self, context: AnimationContext) -> None:
+        """
+        Move an animation context to the AnimationScheduler of the element's View, or unschedule it if the
+        element isn't in a View, in which case the element advances it itself.
+        """
+        view = self.layer.view if self.layer is not None else None
+        scheduler = view.animation_scheduler if view is not None else None
+        if context.scheduler is scheduler:
+            return
+        if context.scheduler is not None:
+            context.scheduler.discard(context)
+        if scheduler is not None:
+            scheduler.add(self, context)
+
     def _update(self) -> None:
         """
         Used intenally by the library.
         """
 
     def update_ancestry(self, ancestry: list["Element"]) -> None:
+        if not ancestry:
+            # The element is being removed, so the area it covered needs redrawing
+            self.mark_dirty()
         self.ancestry = ancestry
         log.ancestry.info(f"Updated ancestry.", self)
 
@@ -481,8 +540,16 @@ class Element(abc.ABC, metaclass=ElementMeta):
         else:
             self.parent, self.layer = None, None
 
+        # Running animations follow the element to its new View
+        for anim_context in self._animation_contexts:
+            self._schedule_animation(anim_context)
+
     def update_cascading_value(self, value: CascadingTraitValue, depth: int) -> None:
         if isinstance(self, value.ref.owner):
+            context = getattr(self, value.ref.trait.context_name, None)
+            if context is not None and context.parent_value is value.value:
+                log.cascade.info("Value unchanged, did not set", self)
+                return
             # We have to use setattr here because of CanPivot properties
             log.cascade.info("Value set", self)
             setattr(self, value.ref.trait.name, value.value)
@@ -5,6 +5,7 @@ from typing import Union, TYPE_CHECKING, Optional, Sequence, Callable, Iterable,
 from ember import log
 
 from ember.on_event import queue as on_event_queue
+from ember.trait.base_trait import BaseTrait
 
 if TYPE_CHECKING:
     from .element import Element
@@ -16,6 +17,7 @@ MethodCallable = Callable[["Element"], None]
 class ElementMeta(abc.ABCMeta, type):
     def __init__(cls: Type["Element"], name, bases, attrs):
         super().__init__(name, bases, attrs)
+        cls._update_trait_layout()
 
         if on_event_queue or (
             len(bases) > 1
@@ -45,3 +47,26 @@ class ElementMeta(abc.ABCMeta, type):
                     )
                     cls._callback_registry.add_callback(item[1], item[0])
                 on_event_queue.clear()
+
+    def __setattr__(cls, name: str, value) -> None:
+        super().__setattr__(name, value)
+        if isinstance(value, BaseTrait):
+            # A trait was replaced (for example, when its default value was changed for this class)
+            cls._update_trait_layout()
+
+    def _update_trait_layout(cls) -> None:
+        """
+        Find the traits of the class, so that their contexts can be created when an instance is created
+        instead of when the trait is first accessed.
+        """
+        traits = {}
+        for klass in reversed(cls.__mro__):
+            for name, attr in vars(klass).items():
+                if isinstance(attr, BaseTrait):
+                    traits[name] = attr
+                elif name in traits:
+                    del traits[name]
+        type.__setattr__(cls, "_trait_layout", tuple(traits.values()))
+
+        for subclass in cls.__subclasses__():
+            subclass._update_trait_layout()
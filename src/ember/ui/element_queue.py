@@ -0,0 +1,106 @@
+from typing import TYPE_CHECKING, Any, Iterator
+
+if TYPE_CHECKING:
+    from ember.ui.element import Element
+
+
+class ElementQueue:
+    """
+    A queue of Elements, ordered by the depth of each Element in the element tree. Used internally by
+    :py:class:`ViewLayer<ember.ui.ViewLayer>` to hold layout work for the next tick.
+
+    Each Element can only be queued once. Membership checks, insertion and removal are O(1). Popping is
+    proportional to the depth of the element tree rather than the number of queued Elements.
+    Elements with the same depth are popped in the order that they were added.
+    """
+
+    __slots__ = ("deepest_first", "_buckets", "_depths")
+
+    def __init__(self, deepest_first: bool = False) -> None:
+        self.deepest_first: bool = deepest_first
+        """
+        If :code:`True`, the most deeply nested Elements are popped first.
+        If :code:`False`, the least deeply nested Elements are popped first.
+        """
+
+        self._buckets: dict[int, dict["Element", Any]] = {}
+        self._depths: dict["Element", int] = {}
+
+    def __repr__(self) -> str:
+        return f"<ElementQueue({len(self._depths)} elements)>"
+
+    def __len__(self) -> int:
+        return len(self._depths)
+
+    def __bool__(self) -> bool:
+        return bool(self._depths)
+
+    def __contains__(self, element: "Element") -> bool:
+        return element in self._depths
+
+    def __iter__(self) -> Iterator["Element"]:
+        return iter(self._depths)
+
+    def add(self, element: "Element", value: Any = None) -> bool:
+        """
+        Queue an Element, optionally with a value attached to it. If the Element is already queued,
+        the attached value is replaced only if the new value is truthy. Returns :code:`True` if the
+        Element was not already queued.
+        """
+        if (depth := self._depths.get(element)) is not None:
+            if value:
+                self._buckets[depth][element] = value
+            return False
+
+        depth = len(element.ancestry)
+        self._depths[element] = depth
+        if (bucket := self._buckets.get(depth)) is None:
+            bucket = self._buckets[depth] = {}
+        bucket[element] = value
+        return True
+
+    def discard(self, element: "Element") -> bool:
+        """
+        Remove an Element from the queue if it is present. Returns :code:`True` if the Element was removed.
+        """
+        if (depth := self._depths.pop(element, None)) is None:
+            return False
+        bucket = self._buckets[depth]
+        del bucket[element]
+        if not bucket:
+            del self._buckets[depth]
+        return True
+
+    def remove(self, element: "Element") -> None:
+        """
+        Remove an Element from the queue. Raises :code:`KeyError` if the Element isn't queued.
+        """
+        if not self.discard(element):
+            raise KeyError(element)
+
+    def pop_item(self) -> tuple["Element", Any]:
+        """
+        Remove and return the next Element along with its attached value.
+        Raises :code:`KeyError` if the queue is empty.
+        """
+        if not self._buckets:
+            raise KeyError("pop from an empty ElementQueue")
+
+        depth = max(self._buckets) if self.deepest_first else min(self._buckets)
+        bucket = self._buckets[depth]
+        element = next(iter(bucket))
+        value = bucket.pop(element)
+        if not bucket:
+            del self._buckets[depth]
+        del self._depths[element]
+        return element, value
+
+    def pop(self) -> "Element":
+        """
+        Remove and return the next Element. Raises :code:`KeyError` if the queue is empty.
+        """
+        return self.pop_item()[0]
+
+    def clear(self) -> None:
+        self._buckets.clear()
+        self._depths.clear()
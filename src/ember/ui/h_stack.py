@@ -19,6 +19,7 @@ class HStack(Stack):
         self,
         *elements: Optional[SequenceElementType],
         cascading: Union[CascadingTraitValue, Sequence[CascadingTraitValue]] = (),
+        cache_render: Optional[bool] = None,
         spacing: Optional[SpacingType] = None,
         focus_on_entry: Optional[FocusType] = None,
         rect: Union[pygame.rect.RectType, Sequence, None] = None,
@@ -42,6 +43,7 @@ class HStack(Stack):
             w=w,
             h=h,
             cascading=cascading,
+            cache_render=cache_render,
             axis=HORIZONTAL
         )
 
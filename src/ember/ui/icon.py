@@ -121,8 +121,8 @@ class Icon(MultiLayerSurfacable):
         Set the icon image. The 'name' parameter can be a name of an icon included in the :py:class`IconFont<ember.font.IconFont`
         object, or it can be a pygame Surface.
 
-        If it is a Surface, the Surface should contain only black and transparent pixels. Be aware that the Icon will reference
-        the original surface, and may modify its pixels. If you don't want this to happen, pass a copy of the Surface instead.
+        If it is a Surface, the Surface should contain only black and transparent pixels. The Icon will reference
+        the original surface, but won't modify its pixels.
 
         A color can optionally be specified here too. If no color is specified, the color of the Icon will not change. This method
         is synonymous with the :code:`name` property setter.
@@ -143,6 +143,7 @@ class Icon(MultiLayerSurfacable):
 
         with log.mls.indent("Icon changed, generating surfaces...", self):
             self._generate_surface(layers, surfaces)
+        self.mark_dirty()
 
         if _update:
             self.update_min_size_next_tick()
\ No newline at end of file
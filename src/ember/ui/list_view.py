@@ -0,0 +1,326 @@
+import math
+import pygame
+from typing import Optional, Union, Sequence, Callable, Any, Iterable
+
+from ember import log
+from ember import common as _c
+from ember.common import ElementType, FOCUS_AXIS_FORWARD, FOCUS_AXIS_BACKWARD
+from ember.axis import VERTICAL
+from ember.size import FILL, FillSize, SizeType, OptionalSequenceSizeType
+from ember.position import PositionType, SequencePositionType
+
+from ember.trait.trait import Trait
+from ember.trait.cascading_trait_value import CascadingTraitValue
+
+from .element import Element
+from .can_hover import CanHover
+from .can_focus import CanHandleFocusChildDependent
+from .scroll import Scroll
+
+
+class ListView(CanHover, CanHandleFocusChildDependent, Scroll):
+    """
+    A vertically scrolling list that displays one row for each item in a data sequence. Only the rows that
+    are visible on screen are created, so the cost of layout and rendering doesn't depend on the length of
+    the data sequence. All rows have the same height.
+
+    Rows are created by calling :code:`row_factory` with the item that the row represents. If :code:`bind_row`
+    is given, rows that are scrolled out of view are kept and reused for other items - :code:`bind_row` is called
+    with the reused row and the new item, and should update the row to display that item.
+
+    The child elements of a ListView are managed by the ListView itself, and shouldn't be modified directly.
+    """
+
+    row_height: float = Trait(20, on_update=lambda self: self._rows_modified())
+    """
+    The height of each row.
+    """
+
+    spacing: float = Trait(0, on_update=lambda self: self._rows_modified())
+    """
+    The vertical space between each row.
+    """
+
+    def __init__(
+        self,
+        data: Sequence[Any] = (),
+        row_factory: Callable[[Any], ElementType] = str,
+        bind_row: Optional[Callable[[Element, Any], None]] = None,
+        row_height: Optional[float] = None,
+        spacing: Optional[float] = None,
+        cascading: Union[CascadingTraitValue, Sequence[CascadingTraitValue]] = (),
+        cache_render: Optional[bool] = None,
+        rect: Union[pygame.rect.RectType, Sequence, None] = None,
+        pos: Optional[SequencePositionType] = None,
+        x: Optional[PositionType] = None,
+        y: Optional[PositionType] = None,
+        size: OptionalSequenceSizeType = None,
+        w: Optional[SizeType] = None,
+        h: Optional[SizeType] = None,
+    ):
+        self._data: Sequence[Any] = data
+        self.row_factory: Callable[[Any], ElementType] = row_factory
+        """
+        Called with an item from the data sequence to create the row for that item.
+        """
+
+        self.bind_row: Optional[Callable[[Element, Any], None]] = bind_row
+        """
+        Called with an existing row and an item from the data sequence to reuse the row for that item.
+        If :code:`None`, rows are not reused.
+        """
+
+        self._rows: dict[int, Element] = {}
+        self._recycled_rows: list[Element] = []
+        self._first_visible_index: int = 0
+
+        self.row_height = row_height
+        self.spacing = spacing
+
+        super().__init__(
+            # Scroll
+            cascading=cascading,
+            cache_render=cache_render,
+            rect=rect,
+            pos=pos,
+            x=x,
+            y=y,
+            size=size,
+            w=w,
+            h=h,
+        )
+
+    def __repr__(self) -> str:
+        return f"<ListView({len(self._data)} items, {len(self._rows)} rows)>"
+
+    @property
+    def data(self) -> Sequence[Any]:
+        """
+        The sequence of items that the ListView displays.
+        """
+        return self._data
+
+    @data.setter
+    def data(self, value: Sequence[Any]) -> None:
+        self.set_data(value)
+
+    def set_data(self, data: Sequence[Any]) -> None:
+        """
+        Replace the data sequence. Should also be called with the existing sequence if it was modified in-place.
+        """
+        self._data = data
+        for row in self._rows.values():
+            self._release_row(row)
+        self._rows.clear()
+        self._elements.clear()
+        self._rows_modified()
+
+    def _rows_modified(self) -> None:
+        if self._has_built:
+            self.update_min_size_next_tick()
+            self.update_rect_next_tick()
+
+    @property
+    def _pitch(self) -> float:
+        return self.row_height + self.spacing
+
+    @property
+    def content_height(self) -> float:
+        """
+        The total height of all rows. Read-only.
+        """
+        if not self._data:
+            return 0
+        return len(self._data) * self._pitch - self.spacing
+
+    def get_row(self, index: int) -> Optional[Element]:
+        """
+        Returns the row for the item at an index, or :code:`None` if that row isn't currently shown.
+        """
+        return self._rows.get(index)
+
+    def index_of_row(self, row: Element) -> int:
+        """
+        Returns the index of the item that a row currently displays.
+        """
+        for index, element in self._rows.items():
+            if element is row:
+                return index
+        raise ValueError(f"{row} is not a row of {self}.")
+
+    def scroll_to_index(
+        self, index: int, cause: Scroll.MovementCause = Scroll.MovementCause.SET
+    ) -> None:
+        """
+        Scroll the smallest distance possible to make the row at an index fully visible.
+        """
+        top = index * self._pitch
+        if top < self._scroll:
+            self.set_scroll(top, cause)
+        elif top + self.row_height > self._scroll + self.rect.h:
+            self.set_scroll(top + self.row_height - self.rect.h, cause)
+
+    def set_scroll(
+        self, value: float, cause: Scroll.MovementCause = Scroll.MovementCause.SET
+    ) -> None:
+        old_scroll = self._scroll
+        super().set_scroll(value, cause)
+        if self._scroll != old_scroll and self._subsurf is not None:
+            self._update_rows()
+
+    def make_visible(self, element: Element) -> None:
+        self.scroll_to_index(
+            self.index_of_row(element), cause=self.MovementCause.VISIBILITY
+        )
+        super().make_visible(self)
+
+    def _create_row(self, item: Any) -> ElementType:
+        if self.bind_row is not None and self._recycled_rows:
+            row = self._recycled_rows.pop()
+            self.bind_row(row, item)
+            return row
+        return self.row_factory(item)
+
+    def _release_row(self, row: Element) -> None:
+        self.removing_element(row, update=False)
+        if self.bind_row is not None:
+            self._recycled_rows.append(row)
+
+    def _is_pinned(self, row: Element) -> bool:
+        # The focused row (or the row containing the focused element) is kept even when it is scrolled out of view
+        focused = self.layer.element_focused if self.layer is not None else None
+        return focused is not None and (focused is row or row in focused.ancestry)
+
+    def _update_rows(self) -> None:
+        pitch = self._pitch
+        if pitch <= 0:
+            raise _c.Error(f"{self} must have a positive row height.")
+
+        first = max(0, int(self._scroll // pitch))
+        last = min(len(self._data), math.ceil((self._scroll + self.rect.h) / pitch))
+
+        rows_modified = False
+        for index in [i for i in self._rows if not first <= i < last]:
+            if not self._is_pinned(self._rows[index]):
+                self._release_row(self._rows.pop(index))
+                rows_modified = True
+
+        for index in range(first, last):
+            if index not in self._rows:
+                with self.adding_element(
+                    self._create_row(self._data[index]), update=False
+                ) as row:
+                    self._rows[index] = row
+                rows_modified = True
+
+        if rows_modified:
+            self._elements[:] = [self._rows[i] for i in sorted(self._rows)]
+            self._cascade_targets.clear()
+            self.layer.can_focus_update_queue.add(self)
+            self.update_min_size_next_tick()
+            log.size.info(f"Showing rows {first} to {last}.", self)
+
+        self._first_visible_index = first
+
+        with log.size.indent():
+            for index, row in self._rows.items():
+                row_y = self.rect.y + index * pitch - self._scroll
+                row_w = row.get_abs_w(self.rect.w)
+                row.visible = self.visible and first <= index < last
+                row.update_rect(
+                    self._subsurf,
+                    self.rect.x + row.x.get(self.rect.w, row_w, row._axis),
+                    row_y,
+                    row_w,
+                    self.row_height,
+                )
+
+    def _update_rect(
+        self, surface: pygame.Surface, x: float, y: float, w: float, h: float
+    ) -> None:
+        self._update_subsurface(surface)
+        # Clamp the scroll value in case the size of the ListView or the data has changed
+        Scroll.set_scroll(self, self._scroll)
+        self._update_rows()
+
+    def _update_min_size(self) -> None:
+        self._min_size.w = max(
+            [
+                i.get_abs_w()
+                for i in self._elements
+                if i is not None and not isinstance(i.w, FillSize)
+            ]
+            or (20,)
+        )
+        self._min_size.h = self.row_height
+
+    def _render(
+        self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
+    ) -> None:
+        render_surface = self._get_render_surface(surface, offset)
+        for row in self._elements:
+            if row.visible:
+                row.render(render_surface, offset, alpha=alpha)
+
+    def update_can_focus(self) -> None:
+        self.layer.can_focus_update_queue.discard(self)
+
+        # Rows that aren't created yet are assumed to be focusable if the visible rows are
+        can_focus = any(i._can_focus for i in self._elements if i is not None)
+        if self._can_focus != can_focus:
+            self._can_focus = can_focus
+            log.nav.info(f"Changed can_focus to {self._can_focus}.", self)
+            if self.parent is not None:
+                self.parent.update_can_focus()
+
+    def _focus_chain(
+        self, direction: _c.FocusDirection, previous: Optional["Element"] = None
+    ) -> "Element":
+        if direction in {
+            _c.FocusDirection.IN,
+            _c.FocusDirection.IN_FIRST,
+            _c.FocusDirection.SELECT,
+        }:
+            for index in range(self._first_visible_index, len(self._data)):
+                row = self._show_row(index)
+                if row._can_focus:
+                    log.nav.info(f"-> child {row}.")
+                    return row.focus_chain(_c.FocusDirection.IN)
+
+        elif previous in self._elements and direction in {
+            FOCUS_AXIS_BACKWARD[VERTICAL],
+            FOCUS_AXIS_FORWARD[VERTICAL],
+            _c.FocusDirection.FORWARD,
+            _c.FocusDirection.BACKWARD,
+        }:
+            # Select the row for the next/previous item, scrolling to it if necessary
+            if direction in {
+                FOCUS_AXIS_FORWARD[VERTICAL],
+                _c.FocusDirection.BACKWARD,
+            }:
+                indices = range(self.index_of_row(previous) - 1, -1, -1)
+            else:
+                indices = range(self.index_of_row(previous) + 1, len(self._data))
+
+            for index in indices:
+                row = self._show_row(index)
+                if row._can_focus:
+                    log.nav.info(f"-> child {row}.")
+                    return row.focus_chain(_c.FocusDirection.IN)
+
+        log.nav.info(f"-> parent {self.parent}.")
+        return self.parent.focus_chain(direction, previous=self)
+
+    def _show_row(self, index: int) -> Element:
+        self.scroll_to_index(index, cause=self.MovementCause.VISIBILITY)
+        if index not in self._rows:
+            self._update_rows()
+        return self._rows[index]
+
+    @property
+    def _elements_to_render(self) -> Iterable[Element]:
+        return self._elements
+
+
+ListView.w.default_value = FILL
+ListView.h.default_value = FILL
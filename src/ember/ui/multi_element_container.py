@@ -1,6 +1,5 @@
 import pygame
 from abc import ABC
-import copy
 from typing import Optional, Sequence, Generator, TYPE_CHECKING, Iterable
 
 from ember.common import (
@@ -133,8 +132,7 @@ class MultiElementContainer(Container, ABC):
         self._elements.remove(element)
 
     def copy(self) -> "Element":
-        new = copy.copy(self)
-        new.rect = self.rect.copy()
+        new = super().copy()
         new._elements = self.elements.copy()
         return new
 
@@ -66,9 +66,12 @@ class MultiLayerSurfacable(Surfacable):
         self._surface_width: int = 0
         self._surface_height: int = 0
 
+        self._source_surfaces: Sequence[pygame.Surface] = ()
         self._surfaces: list[pygame.Surface] = []
         self._layers: list[int] = []
         self._static_surface: Optional[pygame.Surface] = None
+        # Surfaces that materials which update every tick are applied to, reused every tick
+        self._scratch_surfaces: dict[tuple[int, tuple[int, int]], pygame.Surface] = {}
 
         super().__init__(
             rect=rect, pos=pos, x=x, y=y, size=size, w=w, h=h, can_focus=can_focus
@@ -77,7 +80,8 @@ class MultiLayerSurfacable(Surfacable):
     def _material_trait_update_callback(self) -> None:
         log.mls.line_break()
         with log.mls.indent("Material changed, generating surfaces...", self):
-            self._generate_surface(self._layers, self._surfaces, reapply=True)
+            self._generate_surface(self._layers, self._source_surfaces)
+        self.mark_dirty()
 
     def _render_surfaces(
         self, surface: pygame.Surface, pos: tuple[int, int], alpha: int
@@ -85,14 +89,51 @@ class MultiLayerSurfacable(Surfacable):
         """
         Renders the surface layers.
         """
-        if self._static_surface is not None:
-            self._static_surface.set_alpha(alpha)
-            surface.blit(self._static_surface, pos)
+        self._blit_layer_surfaces(
+            surface, pos, alpha, self._static_surface, self._surfaces
+        )
 
-        for layer, surf in zip(self._layers, self._surfaces):
-            new_surf = surf.copy()
-            self._apply_material_to_surface(new_surf, layer, surface, pos)
-            surface.blit(new_surf, pos)
+    def _blit_layer_surfaces(
+        self,
+        surface: pygame.Surface,
+        pos: tuple[int, int],
+        alpha: int,
+        static_surface: Optional[pygame.Surface],
+        layer_surfaces: Sequence[pygame.Surface],
+    ) -> None:
+        """
+        Renders surfaces generated by :py:meth:`_generate_static_surface` or :py:meth:`_generate_dynamic_surfaces`.
+        """
+        if static_surface is not None:
+            static_surface.set_alpha(alpha)
+            surface.blit(static_surface, pos)
+        elif layer_surfaces:
+            # The materials update every tick, so the element needs to be presented every tick
+            self.mark_dirty()
+
+        for n, (layer, surf) in enumerate(zip(self._layers, layer_surfaces)):
+            material = self._get_layer_material(layer)
+            if material is None or not material.UPDATES_EVERY_TICK:
+                surface.blit(surf, pos)
+                continue
+
+            # Copy the layer into a scratch surface, so that no surface is allocated every tick
+            scratch_surface = self._get_scratch_surface(n, surf.get_size())
+            scratch_surface.fill(0)
+            scratch_surface.blit(surf, (0, 0), special_flags=pygame.BLEND_RGBA_ADD)
+            self._apply_material_to_surface(scratch_surface, layer, surface, pos)
+            surface.blit(scratch_surface, pos)
+
+    def _get_scratch_surface(self, index: int, size: tuple[int, int]) -> pygame.Surface:
+        """
+        Returns a surface of the given size that can be drawn to, creating it if it doesn't exist yet.
+        """
+        if (scratch_surface := self._scratch_surfaces.get((index, size))) is None:
+            scratch_surface = self._scratch_surfaces[index, size] = pygame.Surface(
+                size, pygame.SRCALPHA
+            )
+            log.mls.info(f"Created scratch surface of size {size}.", self)
+        return scratch_surface
 
     def _get_surface(self, alpha: int = 255) -> pygame.Surface:
         surface = self._static_surface.copy()
@@ -105,6 +146,27 @@ class MultiLayerSurfacable(Surfacable):
 
         return surface
 
+    def _reads_surface(self) -> bool:
+        for layer in self._layers:
+            material = self._get_layer_material(layer)
+            if material is not None and (
+                material.UPDATES_EVERY_TICK or material.READS_SURFACE
+            ):
+                return True
+        return False
+
+    def _get_layer_material(self, layer: int) -> Optional["Material"]:
+        """
+        Returns the material that is applied to a layer, or None if no material is applied to it.
+        """
+        if layer == 0:
+            return None
+        if layer == 1:
+            return self.primary_material
+        if layer == 2:
+            return self.secondary_material
+        return self.tertiary_material
+
     def _apply_material_to_surface(
         self,
         surface: pygame.Surface,
@@ -124,13 +186,7 @@ class MultiLayerSurfacable(Surfacable):
             # log.mls.info(self, "Layer=0, no material applied.")
             return
 
-        if layer == 1:
-            material = self.primary_material
-        elif layer == 2:
-            material = self.secondary_material
-        else:
-            material = self.tertiary_material
-
+        material = self._get_layer_material(layer)
         if material.UPDATES_EVERY_TICK == update_mode:
             # log.mls.info(self, f"Material updates_every_tick = {update_mode}; no material applied.")
             return
@@ -147,18 +203,22 @@ class MultiLayerSurfacable(Surfacable):
         self,
         layers: Sequence[int],
         surfaces: Sequence[pygame.Surface],
-        reapply: bool = False,
     ) -> None:
         """
-        Given a list of surfaces and their layer codes, generates the required surfaces for rendering.
-        If :code:`reapply` is :code:`False`, the surfaces will be assumed to be black. If :code:`True`,
-        the function will ensure that the surfaces are black before material application.
+        Given a list of black surfaces and their layer codes, generates the required surfaces for rendering.
+        The given surfaces are never modified - they are copied before materials are applied to them, so
+        they can be shared with other elements.
         """
-        self._surfaces = surfaces
+        self._source_surfaces = surfaces
+        self._scratch_surfaces.clear()
         if self._get_is_static(layers):
-            self._generate_static_surface(layers, surfaces, reapply=reapply)
+            self._static_surface, self._surfaces = self._generate_static_surface(
+                layers, surfaces
+            )
         else:
-            self._generate_dynamic_surfaces(layers, surfaces, reapply=reapply)
+            self._static_surface, self._surfaces = self._generate_dynamic_surfaces(
+                layers, surfaces
+            )
 
     def _get_is_static(self, layers: Sequence[int]) -> bool:
         """
@@ -197,41 +257,42 @@ class MultiLayerSurfacable(Surfacable):
         self,
         layers: Sequence[int],
         surfaces: Sequence[pygame.Surface],
-        reapply: bool = False,
-    ) -> None:
+    ) -> tuple[pygame.Surface, list[pygame.Surface]]:
         """
         Generates a static surface from the Element's materials. This static surface is generated once, and
-        is simply blitted every tick when the Element is rendered.
-
-        If :code:`reapply` is :code:`False`, the surfaces will be assumed to be black. If :code:`True`,
-        the function will ensure that the surfaces are black before material application.
+        is simply blitted every tick when the Element is rendered. Returns the static surface and the list
+        of layer surfaces.
         """
-        for n, (layer, surf) in enumerate(zip(layers, surfaces)):
-            if reapply:
-                surf.fill(0xFFFFFF, special_flags=pygame.BLEND_RGB_SUB)
+        layer_surfaces = [surf.copy() for surf in surfaces]
+        for n, (layer, surf) in enumerate(zip(layers, layer_surfaces)):
             self._apply_material_to_surface(surf, layer, surf, (0, 0), update_mode=True)
 
             if n == 0:
-                self._static_surface = surf
+                static_surface = surf
             else:
-                self._static_surface.blit(surf, (0, 0))
+                static_surface.blit(surf, (0, 0))
         log.mls.info("Generated static surface.", self)
+        return static_surface, layer_surfaces
 
     def _generate_dynamic_surfaces(
-        self, surfaces: Sequence[pygame.Surface], reapply: bool = False
-    ) -> None:
+        self,
+        layers: Sequence[int],
+        surfaces: Sequence[pygame.Surface],
+    ) -> tuple[None, list[pygame.Surface]]:
         """
         Generates a list of surfaces. If the material for a surface needs to update every tick, the surface is
         left black and the material is applied in
         :py:meth:`_render_surfaces<ember.ui.base.MultiLayerSurfacable._render_surfaces>`.
         If the material does not need to update every tick, the material is applied here.
-
-        If :code:`reapply` is :code:`False`, the surfaces will be assumed to be black. If :code:`True`,
-        the function will ensure that the surfaces are black before material application.
+        Returns None in place of a static surface, and the list of layer surfaces.
         """
-        self._static_surface = None
-        for layer, surf in zip(self._layers, surfaces):
-            if reapply:
-                surf.fill(0xFFFFFF, special_flags=pygame.BLEND_RGB_SUB)
-            self._apply_material_to_surface(surf, layer, surf, (0, 0), update_mode=True)
+        layer_surfaces = []
+        for layer, surf in zip(layers, surfaces):
+            material = self._get_layer_material(layer)
+            if material is not None and not material.UPDATES_EVERY_TICK:
+                # Only copy the surfaces that a material is applied to here
+                surf = surf.copy()
+                self._apply_material_to_surface(surf, layer, surf, (0, 0), update_mode=True)
+            layer_surfaces.append(surf)
         log.mls.info("Generated dynamic surfaces.", self)
+        return None, layer_surfaces
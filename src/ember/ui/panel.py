@@ -24,7 +24,7 @@ class Panel(Element):
         w: Optional[SizeType] = None,
         h: Optional[SizeType] = None,
     ):
-        self.material: Optional["Material"] = (
+        self._material: Optional["Material"] = (
             material
             if isinstance(material, Material) or material is None
             else Color(material)
@@ -37,13 +37,37 @@ class Panel(Element):
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
-        rect = self.rect.move([-i for i in surface.get_abs_offset()])
-        if self.material is not None:
+        rect = self.rect.move(
+            offset[0] - surface.get_abs_offset()[0], offset[1] - surface.get_abs_offset()[1]
+        )
+        if self._material is not None:
             x = int(rect.x)
             y = int(rect.y)
             w = int(rect.right - x)
             h = int(rect.bottom - y)
-            self.material.draw(self, surface, (x,y), (w,h), alpha)
+            self._material.draw(self, surface, (x,y), (w,h), alpha)
+            if self._material.UPDATES_EVERY_TICK:
+                self.mark_dirty()
+
+    def _reads_surface(self) -> bool:
+        return self._material is not None and (
+            self._material.UPDATES_EVERY_TICK or self._material.READS_SURFACE
+        )
+
+    @property
+    def material(self) -> Optional["Material"]:
+        """
+        The material drawn in the Panel's area.
+        """
+        return self._material
+
+    @material.setter
+    def material(self, material: Union["Material", ColorType, None]) -> None:
+        if not (isinstance(material, Material) or material is None):
+            material = Color(material)
+        if material is not self._material:
+            self._material = material
+            self.mark_dirty()
 
 Panel.w.default_value = FILL
 Panel.h.default_value = FILL
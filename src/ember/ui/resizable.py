@@ -24,10 +24,13 @@ class Resizable(Box):
     A subclass of Box that can be resized using the mouse.
     """
 
+    intercepts_mouse: bool = True
+
     def __init__(
         self,
         element: Optional[Element] = None,
         handles: Union[Sequence[BasicPosition], BasicPosition, None] = None,
+        cache_render: Optional[bool] = None,
         rect: Union[pygame.rect.RectType, Sequence, None] = None,
         pos: Optional[SequencePositionType] = None,
         x: Optional[PositionType] = None,
@@ -48,6 +51,7 @@ class Resizable(Box):
 
         super().__init__(
             element=element,
+            cache_render=cache_render,
             rect=rect,
             pos=pos,
             x=x,
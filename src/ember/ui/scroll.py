@@ -5,6 +5,7 @@ from enum import Enum
 
 from ember import common as _c
 from ember import log
+from ember.event import SCROLLMOVED
 
 from .multi_element_container import MultiElementContainer
 
@@ -22,6 +23,8 @@ class Scroll(MultiElementContainer, ABC):
         super().__init__(**kwargs)
 
         self._subsurf: Optional[pygame.Surface] = None
+        # The subsurface of the destination surface that child elements were last rendered to
+        self._render_subsurf: Optional[pygame.Surface] = None
         self.scrollable_element_index: int = -1
 
         self._scroll: float = 0
@@ -29,6 +32,14 @@ class Scroll(MultiElementContainer, ABC):
     def _update_rect(
         self, surface: pygame.Surface, x: float, y: float, w: float, h: float
     ) -> None:
+        self._update_subsurface(surface)
+        super()._update_rect(self._subsurf, x, y, w, h)
+        self.scroll = self._scroll
+
+    def _update_subsurface(self, surface: pygame.Surface) -> None:
+        """
+        Create the subsurface that child elements are clipped to, if the existing one is out of date.
+        """
         if (
             self._subsurf is None
             or (*self._subsurf.get_abs_offset(), *self._subsurf.get_size())
@@ -39,13 +50,35 @@ class Scroll(MultiElementContainer, ABC):
             rect = self._int_rect.copy().clip(parent_surface.get_rect())
             self._subsurf = parent_surface.subsurface(rect)
 
-        super()._update_rect(self._subsurf, x, y, w, h)
-        self.scroll = self._scroll
+    def _get_render_surface(
+        self, surface: pygame.Surface, offset: tuple[int, int]
+    ) -> pygame.Surface:
+        """
+        Returns the subsurface of the destination surface that child elements are clipped to when rendering.
+        The destination isn't always the surface that the layout was calculated with, for example when a
+        Container renders its children into its render cache.
+        """
+        abs_offset = surface.get_abs_offset()
+        rect = pygame.Rect(
+            self._int_rect.x + offset[0] - abs_offset[0],
+            self._int_rect.y + offset[1] - abs_offset[1],
+            self._int_rect.w,
+            self._int_rect.h,
+        ).clip(surface.get_rect())
+
+        render_subsurf = self._render_subsurf
+        if (
+            render_subsurf is None
+            or render_subsurf.get_parent() is not surface
+            or (*render_subsurf.get_offset(), *render_subsurf.get_size()) != rect
+        ):
+            render_subsurf = self._render_subsurf = surface.subsurface(rect)
+        return render_subsurf
 
     def _render(
         self, surface: pygame.Surface, offset: tuple[int, int], alpha: int = 255
     ) -> None:
-        super()._render(self._subsurf, offset, alpha)
+        super()._render(self._get_render_surface(surface, offset), offset, alpha)
 
     @property
     def scroll(self) -> float:
@@ -59,16 +92,24 @@ class Scroll(MultiElementContainer, ABC):
     def scrollable_element(self) -> Optional["Element"]:
         return self._elements[self.scrollable_element_index]
 
+    @property
+    def content_height(self) -> float:
+        """
+        The total height of the scrollable content. Read-only.
+        """
+        return self.scrollable_element.rect.h
+
     def set_scroll(
         self, value: float, cause: MovementCause = MovementCause.SET
     ) -> None:
-        if self.scrollable_element.rect.h < self.rect.h:
+        content_height = self.content_height
+        if content_height < self.rect.h:
             val = 0
         else:
             val = pygame.math.clamp(
                 value,
                 0,
-                self.scrollable_element.rect.h - self.rect.h,
+                content_height - self.rect.h,
             )
         if self._scroll != val:
             self._scroll = val
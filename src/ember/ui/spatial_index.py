@@ -0,0 +1,120 @@
+from typing import TYPE_CHECKING, Union, Iterator
+
+import pygame
+
+if TYPE_CHECKING:
+    from ember.ui.element import Element
+
+
+class SpatialIndex:
+    """
+    A uniform grid of Element rects, used internally by :py:class:`ViewLayer<ember.ui.ViewLayer>` to find
+    the interactive Elements under the mouse without checking every Element.
+
+    Updating the rect of an Element is O(1) if it stays within the same grid cells. Querying a point only
+    checks the Elements that overlap the grid cell containing that point.
+    """
+
+    __slots__ = ("cell_size", "max_cells", "_cells", "_large", "_entries")
+
+    def __init__(self, cell_size: int = 64, max_cells: int = 64) -> None:
+        self.cell_size: int = cell_size
+        """
+        The width and height of each grid cell.
+        """
+
+        self.max_cells: int = max_cells
+        """
+        Elements that would cover more than this number of grid cells are stored separately and
+        checked on every query instead.
+        """
+
+        self._cells: dict[tuple[int, int], dict["Element", None]] = {}
+        self._large: dict["Element", None] = {}
+        self._entries: dict["Element", tuple[pygame.FRect, tuple[int, int, int, int]]] = {}
+
+    def __repr__(self) -> str:
+        return f"<SpatialIndex({len(self._entries)} elements)>"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, element: "Element") -> bool:
+        return element in self._entries
+
+    def __iter__(self) -> Iterator["Element"]:
+        return iter(self._entries)
+
+    def _get_span(self, rect: pygame.FRect) -> tuple[int, int, int, int]:
+        size = self.cell_size
+        return (
+            int(rect.left // size),
+            int(rect.top // size),
+            int(rect.right // size),
+            int(rect.bottom // size),
+        )
+
+    def _is_large(self, span: tuple[int, int, int, int]) -> bool:
+        return (span[2] - span[0] + 1) * (span[3] - span[1] + 1) > self.max_cells
+
+    def update(self, element: "Element", rect: Union[pygame.Rect, pygame.FRect]) -> None:
+        """
+        Add an Element to the index, or move it if it is already indexed.
+        """
+        span = self._get_span(rect)
+        if (entry := self._entries.get(element)) is not None:
+            if entry[1] == span:
+                entry[0].update(rect)
+                return
+            self._remove_from_cells(element, entry[1])
+
+        self._entries[element] = (pygame.FRect(rect), span)
+        if self._is_large(span):
+            self._large[element] = None
+            return
+
+        for cell_x in range(span[0], span[2] + 1):
+            for cell_y in range(span[1], span[3] + 1):
+                if (cell := self._cells.get((cell_x, cell_y))) is None:
+                    cell = self._cells[cell_x, cell_y] = {}
+                cell[element] = None
+
+    def discard(self, element: "Element") -> bool:
+        """
+        Remove an Element from the index if it is present. Returns :code:`True` if the Element was removed.
+        """
+        if (entry := self._entries.pop(element, None)) is None:
+            return False
+        self._remove_from_cells(element, entry[1])
+        return True
+
+    def _remove_from_cells(
+        self, element: "Element", span: tuple[int, int, int, int]
+    ) -> None:
+        if self._is_large(span):
+            del self._large[element]
+            return
+
+        for cell_x in range(span[0], span[2] + 1):
+            for cell_y in range(span[1], span[3] + 1):
+                cell = self._cells[cell_x, cell_y]
+                del cell[element]
+                if not cell:
+                    del self._cells[cell_x, cell_y]
+
+    def query_point(self, pos: tuple[float, float]) -> list["Element"]:
+        """
+        Returns the indexed Elements whose rects contain a point.
+        """
+        size = self.cell_size
+        cell = self._cells.get((int(pos[0] // size), int(pos[1] // size)), ())
+        entries = self._entries
+        found = [i for i in cell if entries[i][0].collidepoint(pos)]
+        if self._large:
+            found.extend(i for i in self._large if entries[i][0].collidepoint(pos))
+        return found
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._large.clear()
+        self._entries.clear()
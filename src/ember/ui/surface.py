@@ -105,4 +105,6 @@ class Surface(Surfacable):
         else:
             self._surface = None
 
+        # The new surface might be the same size as the old one, so the rect won't necessarily change
+        self.mark_dirty()
         self.update_min_size()
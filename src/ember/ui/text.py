@@ -1,4 +1,5 @@
 import pygame
+from collections import OrderedDict
 from typing import Union, Optional, TYPE_CHECKING, Sequence
 from .. import log
 from ..common import ColorType
@@ -20,6 +21,9 @@ if TYPE_CHECKING:
 
 from ember.trait import Trait
 
+TILE_LINES = 32
+TILE_CACHE_SIZE = 16
+
 
 class Text(MultiLayerSurfacable):
     """
@@ -42,6 +46,7 @@ class Text(MultiLayerSurfacable):
         tertiary_material: Optional["Material"] = None,
         variant: Union[TextVariant, Sequence[TextVariant], None] = None,
         font: Optional[Font] = None,
+        culled: bool = False,
         rect: Union[pygame.rect.RectType, Sequence, None] = None,
         pos: Optional[SequencePositionType] = None,
         x: Optional[PositionType] = None,
@@ -52,6 +57,24 @@ class Text(MultiLayerSurfacable):
     ):
         self._text: str = text
 
+        # The font, variant and max width that the current surfaces were rendered with
+        self._rendered_with: Optional[tuple[Font, tuple, Optional[float]]] = None
+
+        self.culled: bool = culled
+        """
+        If :code:`True`, only the lines that are visible on the destination surface are rendered. The text is
+        rendered lazily in tiles of :code:`TILE_LINES` lines, and the most recently used tiles are kept.
+        This makes the memory and time used to render very long text depend on the size of the viewport
+        (for example a :py:class:`Scroll<ember.ui.Scroll>`) rather than the length of the text.
+        Materials are applied to each tile separately. Has no effect if the Text has no maximum width.
+        """
+
+        # Whether the text is currently being rendered in tiles
+        self._culling: bool = False
+        self._tiles: OrderedDict[
+            int, tuple[Optional[pygame.Surface], list[pygame.Surface]]
+        ] = OrderedDict()
+
         if isinstance(variant, Sequence):
             variant = tuple(variant)
         elif variant is not None:
@@ -102,7 +125,81 @@ class Text(MultiLayerSurfacable):
             - surface.get_abs_offset()[1],
         )
 
-        self._render_surfaces(surface, pos, alpha)
+        if self._culling:
+            self._render_tiles(surface, pos, alpha)
+        else:
+            self._render_surfaces(surface, pos, alpha)
+
+    def _render_tiles(
+        self, surface: pygame.Surface, pos: tuple[float, float], alpha: int
+    ) -> None:
+        """
+        Renders the tiles that intersect the clip area of the destination surface.
+        """
+        font = self.font
+        tile_height = TILE_LINES * (font.line_height + font.line_spacing)
+        clip = surface.get_clip()
+
+        # Round the position the same way that it would be rounded if the whole text was blitted at once
+        y = int(pos[1])
+        first_tile = max(0, (clip.top - y) // tile_height)
+        last_tile = min(
+            (len(self.lines) - 1) // TILE_LINES, (clip.bottom - y) // tile_height
+        )
+
+        for index in range(first_tile, last_tile + 1):
+            static_surface, layer_surfaces = self._get_tile(index)
+            self._blit_layer_surfaces(
+                surface,
+                (pos[0], y + index * tile_height),
+                alpha,
+                static_surface,
+                layer_surfaces,
+            )
+
+        # The tiles that were just rendered are the most recently used, so they are never evicted here
+        while len(self._tiles) > max(TILE_CACHE_SIZE, last_tile - first_tile + 1):
+            self._tiles.popitem(last=False)
+
+    def _get_tile(
+        self, index: int
+    ) -> tuple[Optional[pygame.Surface], list[pygame.Surface]]:
+        """
+        Returns the surfaces for a tile of lines, rendering them if they aren't cached.
+        """
+        if (tile := self._tiles.get(index)) is not None:
+            self._tiles.move_to_end(index)
+            return tile
+
+        font = self.font
+        lines = self.lines[index * TILE_LINES : (index + 1) * TILE_LINES]
+        tile_height = len(lines) * (font.line_height + font.line_spacing) - font.line_spacing
+        surfaces = [
+            pygame.Surface((self._surface_width, tile_height), pygame.SRCALPHA)
+            for _ in self._layers
+        ]
+        font._render_lines(
+            surfaces,
+            [(i.start_index, i.content, i.wrap_end_index) for i in lines],
+            self._rendered_with[2] - abs(CENTER.value),
+            self.variant,
+            CENTER,
+        )
+
+        if self._get_is_static(self._layers):
+            tile = self._generate_static_surface(self._layers, surfaces)
+        else:
+            tile = self._generate_dynamic_surfaces(self._layers, surfaces)
+        self._tiles[index] = tile
+        log.mls.info(f"Rendered lines {index * TILE_LINES} to {index * TILE_LINES + len(lines)}.", self)
+        return tile
+
+    def _material_trait_update_callback(self) -> None:
+        if self._culling:
+            self._tiles.clear()
+            self.mark_dirty()
+        else:
+            super()._material_trait_update_callback()
 
     def _draw_surface(
         self,
@@ -133,8 +230,8 @@ class Text(MultiLayerSurfacable):
         self, surface: pygame.Surface, x: float, y: float, w: float, h: float
     ) -> None:
         if (
-            self._static_surface is None
-            or self._int_rect.w != self._static_surface.get_width()
+            self._rendered_with is None
+            or self._int_rect.w != self._surface_width
             or self._redraw_next_tick
         ):
             log.size.info(
@@ -158,20 +255,38 @@ class Text(MultiLayerSurfacable):
             self._surface_height if self._surface_height else self.font.line_height
         )
 
-    def _update_surface(self, _update: bool = True) -> None:
+    def _update_surface(
+        self, _update: bool = True, previous_text: Optional[str] = None
+    ) -> None:
         """
-        Recreate the text surfaces and apply materials to them.
+        Recreate the text surfaces and apply materials to them. If :code:`previous_text` is given,
+        the lines before the first changed character are reused.
         """
         max_width = (
             None if self.rect.w == 0 or isinstance(self.w, FitSize) else self.rect.w
         )
-        
-        surfaces, self.lines = self.font.render(
+
+        rendered_with = (self.font, tuple(self.variant), max_width)
+        if self.culled and max_width is not None:
+            self._update_layout(rendered_with, _update)
+            return
+
+        self._culling = False
+        self._tiles.clear()
+        previous = (
+            (previous_text, self._source_surfaces, self.lines)
+            if previous_text is not None and rendered_with == self._rendered_with
+            else None
+        )
+
+        surfaces, self.lines = self.font.render_cached(
             self._text,
             variant=self.variant,
             max_width=max_width,
             align=CENTER,
+            previous=previous,
         )
+        self._rendered_with = rendered_with
 
         if (self._surface_width, self._surface_height) != (
             size := surfaces[0].get_size()
@@ -183,6 +298,7 @@ class Text(MultiLayerSurfacable):
         self._layers = self.font.get_layers(self.variant)
 
         self._generate_surface(self._layers, surfaces)
+        self.mark_dirty()
 
         if self._static_surface:
             log.size.info(
@@ -197,6 +313,57 @@ class Text(MultiLayerSurfacable):
         if _update:
             self.update_min_size_next_tick()
 
+    def _update_layout(
+        self, rendered_with: tuple[Font, tuple, float], _update: bool = True
+    ) -> None:
+        """
+        Lay out the text without rendering it, so that it can be rendered in tiles.
+        """
+        font, variant, max_width = rendered_with
+        lines = font.layout(self._text, variant, max_width, CENTER)
+
+        if self._culling and rendered_with == self._rendered_with:
+            # Keep the tiles before the first line that changed
+            first_changed = min(len(lines), len(self.lines))
+            for n, (old_line, line) in enumerate(zip(self.lines, lines)):
+                if (old_line.start_index, old_line.content, old_line.start_x) != (
+                    line.start_index,
+                    line.content,
+                    line.start_x,
+                ):
+                    first_changed = n
+                    break
+            for index in [i for i in self._tiles if i >= first_changed // TILE_LINES]:
+                del self._tiles[index]
+        else:
+            self._tiles.clear()
+
+        self._culling = True
+        self._rendered_with = rendered_with
+        self.lines = lines
+        self._layers = font.get_layers(variant)
+        self._source_surfaces = ()
+        self._scratch_surfaces.clear()
+        self._static_surface = None
+        self._surfaces = []
+
+        size = (
+            int(max(1, max_width - abs(CENTER.value))),
+            len(lines) * (font.line_height + font.line_spacing) - font.line_spacing,
+        )
+        if (self._surface_width, self._surface_height) != size:
+            self._surface_width, self._surface_height = size
+        else:
+            _update = False
+
+        self.mark_dirty()
+        log.size.info(
+            f"Text laid out in {len(lines)} lines, of size ({self._surface_width}, {self._surface_height}).",
+            self,
+        )
+        if _update:
+            self.update_min_size_next_tick()
+
     # def set_w(self, value: SizeType, _update=True) -> None:
     #     log.size.line_break()
     #     log.mls.line_break()
@@ -223,6 +390,7 @@ class Text(MultiLayerSurfacable):
         :py:property:`text<ember.ui.Text.text>` property setter.
         """
         if text != self._text:
+            previous_text = self._text
             self._text = text
 
             log.size.line_break()
@@ -230,7 +398,7 @@ class Text(MultiLayerSurfacable):
             with log.mls.indent(
                 "Text was set, generating surfaces...", self
             ), log.size.indent("Text was set, generating surfaces...", self):
-                self._update_surface()
+                self._update_surface(previous_text=previous_text)
 
     def get_line(self, line_index: int) -> Optional[Line]:
         """
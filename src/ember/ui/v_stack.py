@@ -17,6 +17,7 @@ class VStack(Stack):
         self,
         *elements: Optional[SequenceElementType],
         cascading: Union[CascadingTraitValue, Sequence[CascadingTraitValue]] = (),
+        cache_render: Optional[bool] = None,
         spacing: Optional[SpacingType] = None,
         focus_on_entry: Optional[FocusType] = None,
         rect: Union[pygame.rect.RectType, Sequence, None] = None,
@@ -39,7 +40,8 @@ class VStack(Stack):
             size=size,
             w=w,
             h=h,
-            cascading=cascading
+            cascading=cascading,
+            cache_render=cache_render,
         )
 
     def __repr__(self) -> str:
@@ -4,13 +4,15 @@ from .. import event as ember_event
 from .. import common as _c
 from .. import log
 from ..common import DefaultType, DEFAULT, RectType
-from typing import Optional, TYPE_CHECKING, Sequence, Union, overload
+from typing import Optional, TYPE_CHECKING, Sequence, Union, overload, ContextManager as _ContextManager
 
 if TYPE_CHECKING:
     from ember.ui.element import Element
 
 from .view_layer import ViewLayer
 from ember.ui.context_manager import ContextManager
+from ..trait.trait_batch import batch
+from ..animation.animation_scheduler import AnimationScheduler
 
 KEY_NAMES = {
     pygame.K_RIGHT: _c.FocusDirection.RIGHT,
@@ -35,6 +37,9 @@ DPAD_NAMES = {
 }
 
 
+MAX_DIRTY_RECTS = 64
+
+
 class View(ContextManager):
     @overload
     def __init__(
@@ -69,6 +74,11 @@ class View(ContextManager):
         Whether keyboard and controller navigation is enabled for this View.
         """
 
+        self.animation_scheduler: AnimationScheduler = AnimationScheduler()
+        """
+        Advances the animations of the elements in the View. Read-only.
+        """
+
         self._layers: list[ViewLayer] = []
 
         if layers and isinstance(layers[0], (Sequence, ViewLayer)):
@@ -98,6 +108,10 @@ class View(ContextManager):
 
         self._joystick_cooldown = 0
         self._prev_rect: tuple[float, float, float, float] = (0, 0, 0, 0)
+        self._prev_alpha: int = 255
+        self._prev_layers: tuple[ViewLayer, ...] = ()
+        self._needs_full_redraw: bool = True
+        self._dirty_rects: list[pygame.Rect] = []
         self._joy_axis_motion: Sequence[int] = [0, 0]
 
         super().__init__()
@@ -122,9 +136,22 @@ class View(ContextManager):
         render: bool = True,
         alpha: int = 255,
         display_zoom: Union[DefaultType, int] = DEFAULT,
-    ) -> None:
+        layout_budget: Optional[float] = None,
+        layout_element_budget: Optional[int] = None,
+    ) -> list[pygame.Rect]:
         """
         Update the View. This should be called every tick.
+
+        By default, all pending layout work is finished before rendering. :code:`layout_budget` limits the time,
+        in milliseconds, that can be spent on layout this tick, and :code:`layout_element_budget` limits the number
+        of queued elements that can be processed. When the budget runs out, the remaining work is carried over to
+        the next tick, and elements that haven't been updated yet are rendered with their previous geometry.
+        :py:attr:`layout_settled<ember.ui.View.layout_settled>` tells you whether any work is still pending.
+
+        Returns a list of the areas of the surface that changed since the previous render. This can be
+        passed to :code:`pygame.display.update` instead of flipping the whole display. The areas are in
+        the coordinate space of the surface's topmost parent Surface, so if you scale the surface before
+        displaying it, you'll need to scale the rects too.
         """
         _c.delta_time = 1 / max(1.0, _c.clock.get_fps())
 
@@ -137,6 +164,22 @@ class View(ContextManager):
             if rect is None:
                 rect = (0, 0, *surface.get_size())
 
+        if (
+            (update_positions and tuple(rect) != self._prev_rect)
+            or alpha != self._prev_alpha
+            or tuple(self._layers) != self._prev_layers
+        ):
+            self._needs_full_redraw = True
+        self._prev_alpha = alpha
+        self._prev_layers = tuple(self._layers)
+
+        dirty_rects = []
+
+        deadline = (
+            None if layout_budget is None else time.perf_counter() + layout_budget / 1000
+        )
+        remaining_elements = layout_element_budget
+
         for layer in self._layers:
             if update_positions:
                 layer_w = layer.get_abs_w(rect[2])
@@ -168,17 +211,22 @@ class View(ContextManager):
                         "--------------------- TICK START ---------------------"
                     )
                     i = 0
-                    start_time = time.time()
-                    if layer.can_focus_update_queue:
-                        layer.can_focus_update_queue.sort(key=lambda x: len(x.ancestry), reverse=True)
-                        while layer.can_focus_update_queue:
-                            element = layer.can_focus_update_queue.pop(0)
-                            log.nav.line_break()
-                            with log.nav.indent(f"Starting can_focus update for {element}..."):
-                                element.update_can_focus()
+                    while layer.can_focus_update_queue:
+                        element = layer.can_focus_update_queue.pop()
+                        log.nav.line_break()
+                        with log.nav.indent(f"Starting can_focus update for {element}..."):
+                            element.update_can_focus()
 
                     while layer.rect_update_queue or layer.min_size_update_queue:
                         if i > 0:
+                            if (
+                                remaining_elements is not None and remaining_elements <= 0
+                            ) or (deadline is not None and time.perf_counter() >= deadline):
+                                log.size.line_break()
+                                log.size.info(
+                                    "Layout budget exhausted, continuing next tick."
+                                )
+                                break
                             log.size.line_break()
                             log.size.info(
                                 "Queues aren't empty, going around again..."
@@ -187,7 +235,11 @@ class View(ContextManager):
                                 raise _c.Error(
                                     "The maximimum number of ViewLayer updates on a single tick (300) was exceeded."
                                 )
-                        layer._process_queues(surface)
+                        processed = layer._process_queues(
+                            surface, deadline, remaining_elements
+                        )
+                        if remaining_elements is not None:
+                            remaining_elements -= processed
                         i += 1
                     log.size.line_break()
                     log.size.info(
@@ -199,10 +251,22 @@ class View(ContextManager):
 
             if render:
                 layer.render(surface, (0, 0), alpha)
+                dirty_rects.extend(layer._pop_dirty_rects())
 
         self._prev_rect = tuple(rect)
 
+        if render:
+            bounds = pygame.Rect(surface.get_abs_offset(), surface.get_size())
+            if self._needs_full_redraw:
+                self._dirty_rects = [bounds]
+                self._needs_full_redraw = False
+            else:
+                self._dirty_rects = self._merge_dirty_rects(dirty_rects, bounds)
+        else:
+            self._dirty_rects = []
+
         if update_elements:
+            self.animation_scheduler.update()
             for layer in reversed(self._layers):
                 layer.update()
 
@@ -232,6 +296,29 @@ class View(ContextManager):
                     self._joystick_cooldown = 1
                     self.shift_focus(direction)
 
+        return self._dirty_rects
+
+    @staticmethod
+    def _merge_dirty_rects(
+        rects: Sequence[pygame.Rect], bounds: pygame.Rect
+    ) -> list[pygame.Rect]:
+        """
+        Clip the rects to the bounds and merge any rects that overlap.
+        """
+        if len(rects) > MAX_DIRTY_RECTS:
+            # Merging is quadratic, and a single update is cheaper at this point anyway
+            return [rects[0].unionall(rects[1:]).clip(bounds)]
+
+        merged: list[pygame.Rect] = []
+        for rect in rects:
+            rect = rect.clip(bounds)
+            if not rect:
+                continue
+            while (index := rect.collidelist(merged)) != -1:
+                rect.union_ip(merged.pop(index))
+            merged.append(rect)
+        return merged
+
     def event(self, event: pygame.event.Event) -> bool:
         """
         Passes Pygame Events to the View. This should be called for each event in the event stack.
@@ -356,6 +443,13 @@ class View(ContextManager):
         """
         return self._layers[index]
 
+    def batch(self) -> _ContextManager[None]:
+        """
+        A context manager that defers trait callbacks until the block exits, so that the elements
+        modified inside it are each queued for layout once. The same as :py:func:`ember.batch<ember.trait.batch>`.
+        """
+        return batch()
+
     def update_elements(self) -> None:
         log.size.info("Starting chain down next tick for all layers...")
         for layer in self._layers:
@@ -375,6 +469,22 @@ class View(ContextManager):
         for layer in self._layers:
             layer.start_manual_update()
 
+    @property
+    def dirty_rects(self) -> list[pygame.Rect]:
+        """
+        The areas of the surface that changed during the last :py:meth:`update<ember.ui.View.update>` call. Read-only.
+        """
+        return self._dirty_rects
+
+    @property
+    def layout_settled(self) -> bool:
+        """
+        Whether all layout work has been processed, so that every element is displayed with up-to-date
+        geometry. This is only False when the layout budget passed to :py:meth:`update<ember.ui.View.update>`
+        ran out before the work was finished. Read-only.
+        """
+        return all(layer.layout_settled for layer in self._layers)
+
     @property
     def layers(self) -> list[ViewLayer]:
         """
@@ -1,4 +1,6 @@
 import pygame
+import math
+import time
 from .. import event as ember_event
 from .. import common as _c
 from ..common import DEFAULT, DefaultType
@@ -7,12 +9,15 @@ from typing import Optional, TYPE_CHECKING, Any, Sequence, Union, TypeVar
 
 if TYPE_CHECKING:
     from .view import View
+    from .can_hover import CanHover
 
 from ember.ui.element import Element
 from ember.ui.single_element_container import SingleElementContainer
 from ember.ui.can_focus import CanHandleFocus, CanFocus
 
 from ember.ui.scroll import Scroll
+from ember.ui.element_queue import ElementQueue
+from ember.ui.spatial_index import SpatialIndex
 
 from ..size import SizeType, OptionalSequenceSizeType, FILL
 from ember.position import (
@@ -63,6 +68,16 @@ class ViewLayer(CanHandleFocus, SingleElementContainer[T]):
         The element that is currently focused.
         """
 
+        self._dirty_rects: list[pygame.Rect] = []
+
+        self.hover_index: SpatialIndex = SpatialIndex()
+        """
+        A spatial index of the rects of the hoverable elements in the layer.
+        """
+
+        self._hovered_elements: set["CanHover"] = set()
+        self._mouse_grab: Optional["Element"] = None
+
         super().__init__(
             element=element,
             rect=rect,
@@ -82,9 +97,9 @@ class ViewLayer(CanHandleFocus, SingleElementContainer[T]):
         You can trigger the exit transition yourself by calling ViewLayer.exit() if you prefer.
         """
 
-        self.can_focus_update_queue: list[Element] = []
-        self.min_size_update_queue: list[tuple[Element, bool]] = []
-        self.rect_update_queue: list[Element] = []
+        self.can_focus_update_queue: ElementQueue = ElementQueue(deepest_first=True)
+        self.min_size_update_queue: ElementQueue = ElementQueue(deepest_first=True)
+        self.rect_update_queue: ElementQueue = ElementQueue()
 
         self._exit_cause: Optional[Element] = None
         self._exit_kwargs: dict[Any:Any] = {}
@@ -97,17 +112,37 @@ class ViewLayer(CanHandleFocus, SingleElementContainer[T]):
     def __repr__(self) -> str:
         return f"<ViewLayer>"
 
-    def _process_queues(self, surface: pygame.Surface) -> None:
+    def _process_queues(
+        self,
+        surface: pygame.Surface,
+        deadline: Optional[float] = None,
+        max_elements: Optional[int] = None,
+    ) -> int:
+        """
+        Process the layout queues. If a deadline (from :code:`time.perf_counter`) or a maximum number of
+        queued elements is given, processing stops once it is reached, and the remaining work is left in the
+        queues. Even if the budget runs out during min size updates, at least one rect update is processed,
+        so that the rects of elements keep catching up with their min sizes. Returns the number of elements processed.
+        """
+        processed = 0
+
+        def budget_exhausted() -> bool:
+            return (max_elements is not None and processed >= max_elements) or (
+                deadline is not None and time.perf_counter() >= deadline
+            )
+
         while self.min_size_update_queue:
-            element, must_update_parent = self.min_size_update_queue.pop(0)
+            element, must_update_parent = self.min_size_update_queue.pop_item()
             log.size.line_break()
             with log.size.indent(f"Starting min size update from element {element}."):
                 element.update_min_size(must_update_parent=must_update_parent)
+            processed += 1
+            if budget_exhausted():
+                break
 
         i = 0
         while self.rect_update_queue:
-            self.rect_update_queue.sort(key=lambda a: len(a.ancestry))
-            element = self.rect_update_queue.pop(0)
+            element = self.rect_update_queue.pop()
             log.size.line_break()
 
             if i > 0:
@@ -132,9 +167,84 @@ class ViewLayer(CanHandleFocus, SingleElementContainer[T]):
                 raise _c.Error(
                     "The maximimum number of update_rect calls from a ViewLayer on a single tick (300) was exceeded."
                 )
+            processed += 1
+            if (self.rect_update_queue or self.min_size_update_queue) and budget_exhausted():
+                return processed
+
+        return processed
+
+    def _update(self) -> None:
+        self._update_hovered()
+        super()._update()
+
+    def _update_hovered(self) -> None:
+        hovered = set(self.hover_index.query_point(_c.mouse_pos))
+        if hovered == self._hovered_elements:
+            return
+
+        for element in self._hovered_elements - hovered:
+            element._set_hovered(False)
+        for element in hovered - self._hovered_elements:
+            element._set_hovered(True)
+        self._hovered_elements = hovered
+
+    def _remove_hoverable(self, element: "CanHover") -> None:
+        self.hover_index.discard(element)
+        if element in self._hovered_elements:
+            self._hovered_elements.remove(element)
+            element._hovered = False
+        if self._mouse_grab is element:
+            self._mouse_grab = None
+
+    def _route_mouse_event(self, event: pygame.event.Event) -> Optional[bool]:
+        """
+        Pass a mouse button event directly to the hovered elements, in the same order that walking
+        the element tree would reach them, instead of walking the element tree. Returns None if the
+        event wasn't passed to any element and should be passed down the element tree instead.
+        """
+        if event.type == pygame.MOUSEBUTTONDOWN:
+            hovered = self._hovered_elements
+            if not hovered or any(
+                i.intercepts_mouse for element in hovered for i in element.ancestry
+            ):
+                # An ancestor might want to handle the event before its children do
+                return None
+
+            # Containers pass events to their children, so elements inside another hovered element
+            # receive the event from that element
+            outermost = [i for i in hovered if hovered.isdisjoint(i.ancestry)]
+            for element in sorted(outermost, key=self._get_event_order):
+                if element._event(event):
+                    self._mouse_grab = element
+                    return True
+            return False
+
+        if self._mouse_grab is not None:
+            element, self._mouse_grab = self._mouse_grab, None
+            return element._event(event)
+
+        return None
+
+    @staticmethod
+    def _get_event_order(element: "Element") -> tuple[float, ...]:
+        # Containers pass events to their children in order, before handling them themselves,
+        # so an element comes after its descendants and after the elements of earlier siblings
+        path = []
+        for parent, child in zip(element.ancestry, element.ancestry[1:] + [element]):
+            children = list(parent._elements_to_render)
+            path.append(children.index(child) if child in children else len(children))
+        path.append(math.inf)
+        return tuple(path)
 
     def _event(self, event: pygame.event.Event) -> bool:
-        if self._element is not None and self._element._event(event):
+        routed = None
+        if event.type in {pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP}:
+            routed = self._route_mouse_event(event)
+            if routed:
+                return True
+
+        # Elements that the event was routed to have already received it
+        if routed is None and self._element is not None and self._element._event(event):
             return True
 
         if event.type == pygame.MOUSEBUTTONDOWN and self.view._layers[0] is not self:
@@ -191,12 +301,29 @@ class ViewLayer(CanHandleFocus, SingleElementContainer[T]):
         if self.view._layers[0] is not self:
             self.view._layers.remove(self)
 
+    def add_dirty_rect(self, rect: Union[pygame.Rect, pygame.FRect]) -> None:
+        """
+        Mark an area of the layer as changed since the last time the View was rendered.
+        """
+        x, y = math.floor(rect.x), math.floor(rect.y)
+        # Text is sometimes drawn at half-pixel offsets, so leave a pixel of margin on each side
+        self._dirty_rects.append(
+            pygame.Rect(
+                x - 1, y - 1, math.ceil(rect.right) - x + 2, math.ceil(rect.bottom) - y + 2
+            )
+        )
+
+    def _pop_dirty_rects(self) -> list[pygame.Rect]:
+        rects = self._dirty_rects
+        self._dirty_rects = []
+        return rects
+
     def start_manual_update(self) -> None:
         """
         Starts the update chain on the next tick. You shouldn't need to call this manually, it exists incase the
         library misses something.
         """
-        self.rect_update_queue.append(self)
+        self.rect_update_queue.add(self)
 
     def update_can_focus(self) -> None:
         pass
@@ -235,8 +362,15 @@ class ViewLayer(CanHandleFocus, SingleElementContainer[T]):
                     # element.scroll_to_element(self.element_focused)
 
     def update_rect_next_tick(self) -> None:
-        if self not in self.layer.rect_update_queue:
-            self.layer.rect_update_queue.append(self)
+        self.layer.rect_update_queue.add(self)
+
+    @property
+    def layout_settled(self) -> bool:
+        """
+        Whether all layout work for the layer has been processed. This is only False when the View's
+        layout budget ran out before the layout queues were emptied. Read-only.
+        """
+        return not (self.rect_update_queue or self.min_size_update_queue)
 
     @property
     def index(self) -> int:
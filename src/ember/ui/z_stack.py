@@ -27,6 +27,7 @@ class ZStack(FocusPassthrough):
         self,
         *elements: Optional[SequenceElementType],
         focus_on_entry: Optional[FocusType] = FOCUS_LAST,
+        cache_render: Optional[bool] = None,
         rect: Union[pygame.rect.RectType, Sequence, None] = None,
         pos: Optional[SequencePositionType] = None,
         x: Optional[PositionType] = None,
@@ -39,6 +40,7 @@ class ZStack(FocusPassthrough):
             # Stack
             *elements,
             focus_on_entry=focus_on_entry,
+            cache_render=cache_render,
             rect=rect,
             pos=pos,
             x=x,
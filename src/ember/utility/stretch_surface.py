@@ -1,50 +1,103 @@
 import pygame
+from collections import OrderedDict
 from typing import Sequence
 from ..utility.spritesheet import SpriteSheet
 
+STRIP_CACHE_SIZE = 16
+
+
+class NineSlice:
+    """
+    Stretches a surface to many sizes while preserving its edges. The surface is cut into nine pieces once,
+    and edge strips that have been scaled to a length are kept. When only the width or only the height
+    of the target size changes, the strips along the other axis are reused.
+    """
+
+    def __init__(
+        self, surf: pygame.Surface, edge: Sequence[int] = (10, 10, 10, 10)
+    ) -> None:
+        self.surface: pygame.Surface = surf
+        self.edge: tuple[int, int, int, int] = tuple(edge)
+        self._pieces: dict[str, pygame.Surface] = self._slice(*self.edge)
+        self._strips: OrderedDict[tuple, pygame.Surface] = OrderedDict()
+
+    def __repr__(self) -> str:
+        return f"<NineSlice({self.surface}, edge={self.edge})>"
+
+    def _slice(self, l: int, r: int, t: int, b: int) -> dict[str, pygame.Surface]:
+        surf = self.surface
+        w, h = surf.get_size()
+        return {
+            "mid": surf.subsurface(l, t, w - l - r, h - t - b),
+            "left": surf.subsurface(0, t, l, h - t - b),
+            "right": surf.subsurface(w - r, t, r, h - t - b),
+            "top": surf.subsurface(l, 0, w - l - r, t),
+            "bottom": surf.subsurface(l, h - b, w - l - r, b),
+            "top_left": surf.subsurface(0, 0, l, t),
+            "top_right": surf.subsurface(w - r, 0, r, t),
+            "bottom_left": surf.subsurface(0, h - b, l, b),
+            "bottom_right": surf.subsurface(w - r, h - b, r, b),
+        }
+
+    def _get_strip(
+        self,
+        pieces: dict[str, pygame.Surface],
+        name: str,
+        edge: tuple[int, int, int, int],
+        size: tuple[int, int],
+    ) -> pygame.Surface:
+        key = (name, edge, size)
+        if (strip := self._strips.get(key)) is not None:
+            self._strips.move_to_end(key)
+            return strip
+
+        strip = self._strips[key] = pygame.transform.scale(pieces[name], size)
+        if len(self._strips) > STRIP_CACHE_SIZE:
+            self._strips.popitem(last=False)
+        return strip
+
+    def stretch(self, size: Sequence[int]) -> pygame.Surface:
+        """
+        Returns a new surface of the given size.
+        """
+        nw, nh = max(0, int(size[0])), max(0, int(size[1]))
+        new_surf = pygame.Surface((nw, nh), pygame.SRCALPHA)
+
+        l, r, t, b = self.edge
+
+        if l + r > nw:
+            l = nw // 2
+            r = nw - l
+
+        if t + b > nh:
+            t = nh // 2
+            b = nh - t
+
+        edge = (l, r, t, b)
+        pieces = self._pieces if edge == self.edge else self._slice(*edge)
+
+        # Middle
+        mid = pygame.transform.scale(pieces["mid"], (nw - l - r, nh - t - b))
+        new_surf.blit(mid, (l, t))
+        # Left and right only depend on the height, top and bottom only depend on the width
+        new_surf.blit(self._get_strip(pieces, "left", edge, (l, nh - t - b)), (0, t))
+        new_surf.blit(
+            self._get_strip(pieces, "right", edge, (r, nh - t - b)), (nw - r, t)
+        )
+        new_surf.blit(self._get_strip(pieces, "top", edge, (nw - l - r, t)), (l, 0))
+        new_surf.blit(
+            self._get_strip(pieces, "bottom", edge, (nw - l - r, b)), (l, nh - b)
+        )
+        # Corners
+        new_surf.blit(pieces["top_left"], (0, 0))
+        new_surf.blit(pieces["top_right"], (nw - r, 0))
+        new_surf.blit(pieces["bottom_left"], (0, nh - b))
+        new_surf.blit(pieces["bottom_right"], (nw - r, nh - b))
+
+        return new_surf
+
 
 def stretch_surface(
     surf: pygame.Surface, size: Sequence[int], edge=(10, 10, 10, 10)
 ) -> pygame.Surface:
-    nw, nh = max(0, int(size[0])), max(0, int(size[1]))
-    new_surf = pygame.Surface((nw, nh), pygame.SRCALPHA)
-
-    l, r, t, b = edge
-    w, h = surf.get_size()
-
-    if l + r > nw:
-        l = nw // 2
-        r = nw - l
-
-    if t + b > nh:
-        t = nh // 2
-        b = nh - t
-
-    # Middle
-    mid = pygame.transform.scale(
-        surf.subsurface(l, t, w - l - r, h - t - b), (nw - l - r, nh - t - b),
-    )
-    new_surf.blit(mid, (l, t))
-    # Left
-    left = pygame.transform.scale(surf.subsurface(0, t, l, h - t - b), (l, nh - t - b))
-    new_surf.blit(left, (0, t))
-    # Right
-    right = pygame.transform.scale(
-        surf.subsurface(w - r, t, r, h - t - b), (r, nh - t - b)
-    )
-    new_surf.blit(right, (nw - r, t))
-    # Top
-    top = pygame.transform.scale(surf.subsurface(l, 0, w - l - r, t), (nw - l - r, t))
-    new_surf.blit(top, (l, 0))
-    # Bottom
-    bottom = pygame.transform.scale(
-        surf.subsurface(l, h - b, w - l - r, b), (nw - l - r, b)
-    )
-    new_surf.blit(bottom, (l, nh - b))
-    # Corners
-    new_surf.blit(surf.subsurface(0, 0, l, t), (0, 0))
-    new_surf.blit(surf.subsurface(w - r, 0, r, t), (nw - r, 0))
-    new_surf.blit(surf.subsurface(0, h - b, l, b), (0, nh - b))
-    new_surf.blit(surf.subsurface(w - r, h - b, r, b), (nw - r, nh - b))
-
-    return new_surf
+    return NineSlice(surf, edge).stretch(size)